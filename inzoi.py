@@ -1,71 +1,239 @@
 # Misc Modules
 import os
+import json
+import queue
+import atexit
+import mmap
+import time
+import shutil
+import struct
+import stat as stat_module
+import hashlib
 import logging
 import fnmatch
+import zlib
+import zipfile
+import tempfile
+import threading
+import subprocess
 from pathlib import Path
+from contextlib import ExitStack
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
 
 # PyQt6 Modules
-from PyQt6.QtCore import QFileInfo, QDir  # type: ignore
+from PyQt6.QtCore import QFileInfo, QDir, QDateTime  # type: ignore
+from PyQt6.QtGui import QIcon  # type: ignore
+from PyQt6.QtWidgets import (  # type: ignore
+    QFileDialog,
+    QInputDialog,
+    QMainWindow,
+    QMessageBox,
+)
 
 # Mod Organizer 2 Modules
 import mobase  # type: ignore
 from mobase import IOrganizer, IPlugin  # type: ignore
 
 from ..basic_features import BasicLocalSavegames, BasicModDataChecker, GlobPatterns
+from ..basic_features.basic_save_game_info import BasicGameSaveGame
 from ..basic_features.utils import is_directory
 from ..basic_game import BasicGame
 
 # Set up logging
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+logger.setLevel(logging.INFO)
 
 # Settings Variables
 SymLinkSettingsName = "Deploy Symlinks on Launch"
 LogLevel = "Info"
 
 
+# Per-file detail: the LogLevel check runs before anything is formatted,
+# and the %-style args are only rendered if the record is actually emitted.
+def log_detail(msg: str, *args) -> None:
+    if LogLevel == "Debug":
+        logger.info(msg, *args)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    # Skip QueueHandler's eager formatting, the listener thread formats instead
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+_log_listener: QueueListener | None = None
+
+
+# Hands plugin log records to a background thread that owns the real handlers,
+# so bulk deploys never wait on MO2's synchronous log writes.
+def start_async_logging() -> None:
+    global _log_listener
+    if _log_listener is not None:
+        return
+
+    handlers: list[logging.Handler] = []
+    parent = logger.parent
+    while parent is not None and not handlers:
+        handlers = list(parent.handlers)
+        if not parent.propagate:
+            break
+        parent = parent.parent
+    if not handlers:
+        return
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    logger.addHandler(_DeferredQueueHandler(log_queue))
+    logger.propagate = False
+    _log_listener.start()
+    atexit.register(stop_async_logging)
+
+
+# Flushes the queue and hands logging back to the parent handlers
+def stop_async_logging() -> None:
+    global _log_listener
+    if _log_listener is None:
+        return
+    _log_listener.stop()
+    _log_listener = None
+    for handler in list(logger.handlers):
+        if isinstance(handler, _DeferredQueueHandler):
+            logger.removeHandler(handler)
+    logger.propagate = True
+
+
+# Cache / Store Variables
+CacheFolderName = "inzoi_cache"
+StoreFolderName = "inzoi_store"
+ColdStorageFolderName = "inzoi_cold"
+ColdStorageIndexFileName = "cold.json"
+ColdStorageSettingsName = "Cold Storage After Days Disabled"
+DedupIndexFileName = "dedup_index.json"
+DedupMinFileSize = 64 * 1024  # Files smaller than this are not worth a hardlink
+HashChunkSize = 1024 * 1024
+HashWorkers = min(8, os.cpu_count() or 4)
+GlbIndexFileName = "glb_index.json"
+UsageIndexFileName = "mod_usage.json"
+CreationRegistryFileName = "creation_ids.json"
+GameVersionFileName = "game_version.json"
+GlbMaxSizeSettingsName = "Max 3DPrinter Asset Size (MB)"
+LaunchManifestFileName = "launch_manifest.json"
+HiddenSuffix = ".mohidden"  # MO2 leaves files with this suffix out of the VFS
+
+# Pak Consolidation Variables
+PakMergeSettingsName = "Merge Small Paks on Launch"
+PakToolSettingsName = "Pak Tool Path"
+PakMergeStateFileName = "pak_merge.json"
+# Cached build; it is deployed under the name of the first pak it replaces
+PakMergeOutputName = "inzoi_merged.pak"
+PakMergeMaxFileSize = 8 * 1024 * 1024
+PakUnpackArgs = ["unpack", "--force", "--output", "{output}", "{input}"]
+PakPackArgs = ["pack", "{input}", "{output}"]
+ModsPaksPath = Path("BlueClient") / "Content" / "Paks" / "~mods"
+# Launcher and shipping binaries; only these count as the game running
+GameExecutableNames = (
+    "inzoi.exe",
+    "inzoi-win64-shipping.exe",
+    "blueclient-win64-shipping.exe",
+)
+LinkFarmSettingsName = "Use Profile Link Farms"
+LinkFarmFolderName = "link_farms"
+UserCreationsFolderName = "_creations"
+VfsMappingSettingsName = "Map Documents Through VFS"
+PersistentDeploySettingsName = "Keep Deployment Between Runs"
+DeploymentStateFileName = "deployment_state.json"
+DeploymentSpotCheckSize = 16
+PakDeploySettingsName = "Deploy Paks Physically on Launch"
+PakExtensions = (".pak", ".utoc", ".ucas")
+SkipShadowedSettingsName = "Skip Shadowed Mods on Launch"
+PakBenchmarkBytes = 512 * 1024 * 1024
+
+# Savegame Variables
+SaveIndexFileName = "savegame_index.json"
+SaveHeaderReadSize = 4096
+SnapshotSettingsName = "Snapshot Saves on Launch"
+SnapshotFolderName = "save_snapshots"
+SnapshotKeepCount = 30
+
+
+# Glob patterns shared by the MO2 data checker and the batch install planner
+InzoiFilePatterns = dict(
+    unfold=[
+        "AIGenerated",
+        "Creations",
+        "inZOI",
+    ],
+    valid=[
+        # Validate a mod if the following files are in the root of the mod folder
+        "My3DPrinter",
+        "MyAIMotions",
+        "MySites",
+        "MyAppearances",
+        "BlueClient",
+        "meta.ini",
+    ],
+    delete=[
+        # Delte useless crap that is included in the root of the mod folder
+        "*.txt",
+        "*.md",
+        "README",
+        "icon.png",
+        "license",
+        "LICENCE",
+        "manifest.json",
+        "*.dll.mdb",
+        "*.pdb",
+    ],
+    move={
+        # Correct DLLs at root of mod folder
+        "dwmapi.dll": "BlueClient/Binaries/Win64",
+        "dsound.dll": "BlueClient/Binaries/Win64",
+        # Correct PAK, UCAS or UTOC at root of mod folder
+        "*.pak": "BlueClient/Content/Paks/~mods/",
+        "*.utoc": "BlueClient/Content/Paks/~mods/",
+        "*.ucas": "BlueClient/Content/Paks/~mods/",
+    },
+)
+
+
+# True if the tree holds a .zip archive at its root or in a single wrapper folder
+def has_inner_archive(filetree) -> bool:
+    paths = []
+    for entry in filetree:
+        if not is_directory(entry):
+            paths.append(entry.name())
+            continue
+        for child in entry:
+            if is_directory(child):
+                return False
+            paths.append(f"{entry.name()}/{child.name()}")
+    return is_archive_wrapped(paths)
+
+
+# True if the files (relative posix paths) are inner .zip archives at the root
+# or in one wrapper folder, next to nothing but meta.ini and files the install
+# rules delete anyway. Used both by the checker and to expand installed mods.
+def is_archive_wrapped(paths: list[str]) -> bool:
+    archives = False
+    wrappers = set()
+    for path in paths:
+        parent, _, name = path.rpartition("/")
+        if "/" in parent:
+            return False
+        if parent:
+            wrappers.add(parent)
+        if name.lower().endswith(".zip"):
+            archives = True
+        elif name != "meta.ini" and not _glob_match(name, InzoiFilePatterns["delete"]):
+            return False
+    return archives and len(wrappers) <= 1
+
+
 class InzoiModDataChecker(BasicModDataChecker):
     def __init__(self):
         # Directly pass the GlobPatterns to BasicModDataChecker
-        super().__init__(
-            GlobPatterns(
-                unfold=[
-                    "AIGenerated",
-                    "Creations",
-                    "inZOI",
-                ],
-                valid=[
-                    # Validate a mod if the following files are in the root of the mod folder
-                    "My3DPrinter",
-                    "MyAIMotions",
-                    "MySites",
-                    "MyAppearances",
-                    "BlueClient",
-                    "meta.ini",
-                ],
-                delete=[
-                    # Delte useless crap that is included in the root of the mod folder
-                    "*.txt",
-                    "*.md",
-                    "README",
-                    "icon.png",
-                    "license",
-                    "LICENCE",
-                    "manifest.json",
-                    "*.dll.mdb",
-                    "*.pdb",
-                ],
-                move={
-                    # Correct DLLs at root of mod folder
-                    "dwmapi.dll": "BlueClient/Binaries/Win64",
-                    "dsound.dll": "BlueClient/Binaries/Win64",
-                    # Correct PAK, UCAS or UTOC at root of mod folder
-                    "*.pak": "BlueClient/Content/Paks/~mods/",
-                    "*.utoc": "BlueClient/Content/Paks/~mods/",
-                    "*.ucas": "BlueClient/Content/Paks/~mods/",
-                },
-            )
-        )
+        super().__init__(GlobPatterns(**InzoiFilePatterns))
 
     # Handles subfolder mod data validation
     def dataLooksValid(
@@ -114,8 +282,7 @@ class InzoiModDataChecker(BasicModDataChecker):
                     if f.isFile() and fnmatch.fnmatch(f.name(), "*.glb")
                 ]
                 if motion_files:
-                    if LogLevel == "Debug":
-                        logger.info(f"Found .glb files in folder: {entry.name()}")
+                    log_detail("Found .glb files in folder: %s", entry.name())
                     return self.FIXABLE
 
         # Case: Check for AIMotions mod folder with motion.dat files
@@ -128,8 +295,7 @@ class InzoiModDataChecker(BasicModDataChecker):
                     if f.isFile() and fnmatch.fnmatch(f.name(), "motion.dat")
                 ]
                 if motion_files:
-                    if LogLevel == "Debug":
-                        logger.info(f"Found motion.dat files in folder: {entry.name()}")
+                    log_detail("Found motion.dat files in folder: %s", entry.name())
                     return self.FIXABLE
 
         # Case: Check for MySites mod folder with site.dat files
@@ -142,8 +308,7 @@ class InzoiModDataChecker(BasicModDataChecker):
                     if f.isFile() and fnmatch.fnmatch(f.name(), "site.dat")
                 ]
                 if site_files:
-                    if LogLevel == "Debug":
-                        logger.info(f"Found site.dat files in folder: {entry.name()}")
+                    log_detail("Found site.dat files in folder: %s", entry.name())
                     return self.FIXABLE
 
         # Case: Check for MyAppearances mod folder with appearance.dat files
@@ -156,10 +321,7 @@ class InzoiModDataChecker(BasicModDataChecker):
                     if f.isFile() and fnmatch.fnmatch(f.name(), "appearance.dat")
                 ]
                 if site_files:
-                    if LogLevel == "Debug":
-                        logger.info(
-                            f"Found appearance.dat files in folder: {entry.name()}"
-                        )
+                    log_detail("Found appearance.dat files in folder: %s", entry.name())
                     return self.FIXABLE
 
         # Case: Further checks for valid or fixable 3DPrinter/AIMotion/MySites/MyAppearances mod folder structures
@@ -180,8 +342,7 @@ class InzoiModDataChecker(BasicModDataChecker):
                             if len(name) == 32 and all(
                                 c in "0123456789abcdef" for c in name
                             ):
-                                if LogLevel == "Debug":
-                                    logger.info(f"Proper folder: {folder_name}/{name}")
+                                log_detail("Proper folder: %s/%s", folder_name, name)
                                 return self.VALID
 
                 # Case 2: FIXABLE - Some other folder contains a MD5-named subfolder
@@ -191,20 +352,24 @@ class InzoiModDataChecker(BasicModDataChecker):
                         if len(name) == 32 and all(
                             c in "0123456789abcdef" for c in name
                         ):
-                            if LogLevel == "Debug":
-                                logger.info(
-                                    f"Found misplaced MD5 folder: {folder_name}/{name}"
-                                )
+                            log_detail(
+                                "Found misplaced MD5 folder: %s/%s", folder_name, name
+                            )
                             return self.FIXABLE
 
+        # Case: The real mod is wrapped in an inner .zip, expanded once installed
+        if check_return is self.INVALID and has_inner_archive(filetree):
+            log_detail("Found an inner .zip archive")
+            return self.FIXABLE
+
         return check_return
 
     # Fixes incorrectly packaged mods
     def fix(self, filetree: mobase.IFileTree) -> mobase.IFileTree:
         filetree = super().fix(filetree)
 
-        if LogLevel == "Debug":
-            logger.info("🛠️ Fixing mod data...")
+        log_detail("🛠️ Fixing mod data...")
+        moved = removed = 0
         # Step 1: Flatten AFolder/BlueClient/... to just BlueClient/...
         if (
             len(filetree) == 1
@@ -216,12 +381,15 @@ class InzoiModDataChecker(BasicModDataChecker):
         ):
             for entry in wrapper:
                 if is_directory(entry) and entry.name().lower() == "blueclient":
-                    if LogLevel == "Debug":
-                        logger.info(
-                            f"Flattening wrapper folder: {wrapper.name()} → {entry.name()}"
-                        )
+                    log_detail(
+                        "Flattening wrapper folder: %s → %s",
+                        wrapper.name(),
+                        entry.name(),
+                    )
                     filetree.move(entry, entry.name())
+                    moved += 1
                     filetree.remove(wrapper)
+                    removed += 1
                     break
 
         # Step 1.5: Fix misplaced MD5 folders (e.g. weed plant/<md5>/...)
@@ -237,8 +405,10 @@ class InzoiModDataChecker(BasicModDataChecker):
                         if len(lower_name) == 32 and all(
                             c in "0123456789abcdef" for c in lower_name
                         ):
-                            logger.info(
-                                f"📦 Found misplaced MD5 folder: {outer_folder_name}/{original_md5_name}"
+                            log_detail(
+                                "📦 Found misplaced MD5 folder: %s/%s",
+                                outer_folder_name,
+                                original_md5_name,
                             )
 
                             all_inner_files = [f for f in sub_entry if f.isFile()]
@@ -260,39 +430,48 @@ class InzoiModDataChecker(BasicModDataChecker):
 
                             if has_glb:
                                 target = Path("My3DPrinter") / original_md5_name
-                                logger.info(
-                                    f"✈️ Moving folder to proper 🖨️ 3DPrinter location: {target}"
+                                log_detail(
+                                    "✈️ Moving folder to proper 🖨️ 3DPrinter location: %s",
+                                    target,
                                 )
                                 filetree.move(sub_entry, str(target))
+                                moved += 1
                                 fixed_any = True
 
                             elif has_motion:
                                 target = Path("MyAIMotions") / original_md5_name
-                                logger.info(
-                                    f"✈️ Moving folder to proper 🎭 MyAIMotions location: {target}"
+                                log_detail(
+                                    "✈️ Moving folder to proper 🎭 MyAIMotions location: %s",
+                                    target,
                                 )
                                 filetree.move(sub_entry, str(target))
+                                moved += 1
                                 fixed_any = True
                             elif has_site:
                                 target = Path("MySites") / original_md5_name
-                                logger.info(
-                                    f"✈️ Moving folder to proper 🏠 MySites location: {target}"
+                                log_detail(
+                                    "✈️ Moving folder to proper 🏠 MySites location: %s",
+                                    target,
                                 )
                                 filetree.move(sub_entry, str(target))
+                                moved += 1
                                 fixed_any = True
                             elif has_appearance:
                                 target = Path("MyAppearances") / original_md5_name
-                                logger.info(
-                                    f"✈️ Moving folder to proper 👤 MyAppearances location: {target}"
+                                log_detail(
+                                    "✈️ Moving folder to proper 👤 MyAppearances location: %s",
+                                    target,
                                 )
                                 filetree.move(sub_entry, str(target))
+                                moved += 1
                                 fixed_any = True
 
                 if fixed_any and not any(True for _ in entry):  # Remove outer if empty
-                    logger.info(
-                        f"🧹 Removing empty wrapper folder: {outer_folder_name}"
+                    log_detail(
+                        "🧹 Removing empty wrapper folder: %s", outer_folder_name
                     )
                     filetree.remove(entry)
+                    removed += 1
 
         # Step 2: Handle single-folder case with .pak/.utoc/.ucas
         if (
@@ -309,40 +488,40 @@ class InzoiModDataChecker(BasicModDataChecker):
             all_files = [
                 entry.name() for entry in folder if entry is not None and entry.isFile()
             ]
-            logger.info(
-                f"🧐 Checking for PAK,UTOC or UCAS files in folder: {folder.name()}"
+            log_detail(
+                "🧐 Checking for PAK,UTOC or UCAS files in folder: %s", folder.name()
             )
-            logger.info(f"🗂️ Found files in folder: {', '.join(all_files)}")
+            log_detail("🗂️ Found files in folder: %s", ", ".join(all_files))
 
             for entry in folder:
                 if entry is not None and entry.isFile():
                     file_name = entry.name()
 
-                    if LogLevel == "Debug":
-                        logger.info(f"🧐 Checking file: {file_name}")
+                    log_detail("🧐 Checking file: %s", file_name)
 
                     for ext in file_extensions:
                         if fnmatch.fnmatch(file_name, ext):
-                            logger.info(f"🗂️ File matches: {file_name} (Matches {ext})")
+                            log_detail(
+                                "🗂️ File matches: %s (Matches %s)", file_name, ext
+                            )
                             files_to_move.append(entry)
                             matched_files.append(file_name)
                             break
 
             for file in files_to_move:
                 filetree.move(file, "BlueClient/Content/Paks/~mods/")
-                if LogLevel == "Debug":
-                    logger.info(
-                        f"✈️ Moved {file.name()} to BlueClient/Content/Paks/~mods/"
-                    )
+                moved += 1
+                log_detail("✈️ Moved %s to BlueClient/Content/Paks/~mods/", file.name())
 
             if matched_files:
-                logger.info(f"✈️ Moved files: {', '.join(matched_files)}")
+                log_detail("✈️ Moved files: %s", ", ".join(matched_files))
             else:
-                logger.info("👍 No matching files were moved.")
+                log_detail("👍 No matching files were moved.")
 
             if not any(entry.isFile() for entry in folder):
-                logger.info(f"🧹 Removing empty folder: {folder.name()}")
+                log_detail("🧹 Removing empty folder: %s", folder.name())
                 filetree.remove(folder)
+                removed += 1
 
         # Step 3: Handle 3D printer mod folder logic
         fixable_folders = []  # List to store folders with .glb files
@@ -359,14 +538,14 @@ class InzoiModDataChecker(BasicModDataChecker):
 
                     if glb_files:  # If the folder contains .glb files
                         folder_name = entry.name()
-                        logger.info(f"Found .glb files in folder: {folder_name}")
+                        log_detail("Found .glb files in folder: %s", folder_name)
                         fixable_folders.append(entry)  # Collect folder for fixing
 
         # Process each folder that needs fixing
         for entry in fixable_folders:
             folder_name = entry.name()
-            logger.info(
-                f"Found incorrectly formatted 🖨️ 3DPrinter mod folder: {folder_name}"
+            log_detail(
+                "Found incorrectly formatted 🖨️ 3DPrinter mod folder: %s", folder_name
             )
 
             # If there's only one glb file, make the folder name match the .glb file name
@@ -375,26 +554,30 @@ class InzoiModDataChecker(BasicModDataChecker):
             if len(glb_files) == 1:
                 expected_name = Path(glb_files[0].name()).stem
                 if folder_name != expected_name:
-                    logger.info(
-                        f"Renaming 🖨️ 3DPrinter mod folder: {folder_name} → {expected_name}"
+                    log_detail(
+                        "Renaming 🖨️ 3DPrinter mod folder: %s → %s",
+                        folder_name,
+                        expected_name,
                     )
                     filetree.move(entry, expected_name)
+                    moved += 1
                     folder_name = expected_name
 
-            logger.info(f"🛠️ Fixing 🖨️ 3DPrinter mod folder: {folder_name}")
+            log_detail("🛠️ Fixing 🖨️ 3DPrinter mod folder: %s", folder_name)
             target_dir = Path("My3DPrinter") / folder_name
-            target_dir.mkdir(parents=True, exist_ok=True)
 
             # Moving all files in the directory to the target directory
             for file in all_files:
                 if file is not None and file.isFile():
-                    logger.info(f"✈️ Moving file: {file.name()} to {target_dir}")
+                    log_detail("✈️ Moving file: %s to %s", file.name(), target_dir)
                     filetree.move(file, str(target_dir / file.name()))
+                    moved += 1
 
             # Check if folder is empty after moving files, and remove if so
             if not any(f is not None and f.isFile() for f in entry):
-                logger.info(f"🧹Removing empty folder: {folder_name}")
+                log_detail("🧹Removing empty folder: %s", folder_name)
                 filetree.remove(entry)
+                removed += 1
 
         # Step 4: Handle AIMotion mod folder logic
         fixable_folders = []  # List to store folders with motion.dat files
@@ -410,33 +593,34 @@ class InzoiModDataChecker(BasicModDataChecker):
 
                     if motion_files:  # If the folder contains motion.dat files
                         folder_name = entry.name()
-                        logger.info(f"Found motion.dat files in folder: {folder_name}")
+                        log_detail("Found motion.dat files in folder: %s", folder_name)
                         fixable_folders.append(entry)  # Collect folder for fixing
 
         # Process each folder that needs fixing
         for entry in fixable_folders:
             folder_name = entry.name()
-            logger.info(
-                f"Found incorrectly formatted 🎭 MyAIMotions mod folder: {folder_name}"
+            log_detail(
+                "Found incorrectly formatted 🎭 MyAIMotions mod folder: %s", folder_name
             )
 
             all_files = [f for f in entry if f is not None and f.isFile()]
             motion_files = [f for f in all_files if f.name().lower() == "motion.dat"]
 
-            logger.info(f"🛠️ Fixing 🎭 MyAIMotions mod folder: {folder_name}")
+            log_detail("🛠️ Fixing 🎭 MyAIMotions mod folder: %s", folder_name)
             target_dir = Path("MyAIMotions") / folder_name
-            target_dir.mkdir(parents=True, exist_ok=True)
 
             # Moving all files in the directory to the target directory
             for file in all_files:
                 if file is not None and file.isFile():
-                    logger.info(f"✈️ Moving file: {file.name()} to {target_dir}")
+                    log_detail("✈️ Moving file: %s to %s", file.name(), target_dir)
                     filetree.move(file, str(target_dir / file.name()))
+                    moved += 1
 
             # Check if folder is empty after moving files, and remove if so
             if not any(f is not None and f.isFile() for f in entry):
-                logger.info(f"🧹 Removing empty folder: {folder_name}")
+                log_detail("🧹 Removing empty folder: %s", folder_name)
                 filetree.remove(entry)
+                removed += 1
 
         # Step 5: Handle MySites mod folder logic
         fixable_folders = []  # List to store folders with motion.dat files
@@ -452,33 +636,34 @@ class InzoiModDataChecker(BasicModDataChecker):
 
                     if motion_files:  # If the folder contains motion.dat files
                         folder_name = entry.name()
-                        logger.info(f"Found site.dat files in folder: {folder_name}")
+                        log_detail("Found site.dat files in folder: %s", folder_name)
                         fixable_folders.append(entry)  # Collect folder for fixing
 
         # Process each folder that needs fixing
         for entry in fixable_folders:
             folder_name = entry.name()
-            logger.info(
-                f"Found incorrectly formatted 🏠 MySites mod folder: {folder_name}"
+            log_detail(
+                "Found incorrectly formatted 🏠 MySites mod folder: %s", folder_name
             )
 
             all_files = [f for f in entry if f is not None and f.isFile()]
             motion_files = [f for f in all_files if f.name().lower() == "site.dat"]
 
-            logger.info(f"🛠️ Fixing 🏠 MySites mod folder: {folder_name}")
+            log_detail("🛠️ Fixing 🏠 MySites mod folder: %s", folder_name)
             target_dir = Path("MySites") / folder_name
-            target_dir.mkdir(parents=True, exist_ok=True)
 
             # Moving all files in the directory to the target directory
             for file in all_files:
                 if file is not None and file.isFile():
-                    logger.info(f"✈️ Moving file: {file.name()} to {target_dir}")
+                    log_detail("✈️ Moving file: %s to %s", file.name(), target_dir)
                     filetree.move(file, str(target_dir / file.name()))
+                    moved += 1
 
             # Check if folder is empty after moving files, and remove if so
             if not any(f is not None and f.isFile() for f in entry):
-                logger.info(f"🧹 Removing empty folder: {folder_name}")
+                log_detail("🧹 Removing empty folder: %s", folder_name)
                 filetree.remove(entry)
+                removed += 1
 
         # Step 6: Handle MyAppearances mod folder logic
         fixable_folders = []  # List to store folders with appearance.dat files
@@ -494,40 +679,2002 @@ class InzoiModDataChecker(BasicModDataChecker):
 
                     if appearance_files:  # If the folder contains motion.dat files
                         folder_name = entry.name()
-                        logger.info(
-                            f"Found appearance.dat files in folder: {folder_name}"
+                        log_detail(
+                            "Found appearance.dat files in folder: %s", folder_name
                         )
                         fixable_folders.append(entry)  # Collect folder for fixing
 
         # Process each folder that needs fixing
         for entry in fixable_folders:
             folder_name = entry.name()
-            logger.info(
-                f"Found incorrectly formatted 👤 MyAppearances mod folder: {folder_name}"
+            log_detail(
+                "Found incorrectly formatted 👤 MyAppearances mod folder: %s",
+                folder_name,
             )
 
             all_files = [f for f in entry if f is not None and f.isFile()]
             motion_files = [f for f in all_files if f.name().lower() == "site.dat"]
 
-            logger.info(f"🛠️ Fixing 👤 MyAppearances mod folder: {folder_name}")
+            log_detail("🛠️ Fixing 👤 MyAppearances mod folder: %s", folder_name)
             target_dir = Path("MyAppearances") / folder_name
-            target_dir.mkdir(parents=True, exist_ok=True)
 
             # Moving all files in the directory to the target directory
             for file in all_files:
                 if file is not None and file.isFile():
-                    logger.info(f"✈️ Moving file: {file.name()} to {target_dir}")
+                    log_detail("✈️ Moving file: %s to %s", file.name(), target_dir)
                     filetree.move(file, str(target_dir / file.name()))
+                    moved += 1
 
             # Check if folder is empty after moving files, and remove if so
             if not any(f is not None and f.isFile() for f in entry):
-                logger.info(f"🧹 Removing empty folder: {folder_name}")
+                log_detail("🧹 Removing empty folder: %s", folder_name)
                 filetree.remove(entry)
+                removed += 1
+
+        if moved or removed:
+            logger.info(
+                "🛠️ Fixed mod data: %d entries moved, %d empty folders removed",
+                moved,
+                removed,
+            )
+        return filetree
+
+
+class PathTreeEntry:
+    """A file or folder of an archive listing, mimicking the parts of
+    mobase.IFileTreeEntry/IFileTree the inZOI checker relies on."""
+
+    def __init__(self, name: str, parent: "PathTreeEntry | None", source: str | None):
+        self._name = name
+        self._parent = parent
+        self._children: dict[str, PathTreeEntry] | None = None if source else {}
+        # Archive member this file comes from, None for folders
+        self.source = source
+
+    def name(self) -> str:
+        return self._name
+
+    def isFile(self) -> bool:
+        return self._children is None
+
+    def isDir(self) -> bool:
+        return self._children is not None
+
+    def parent(self) -> "PathTreeEntry | None":
+        return self._parent
+
+    # Children are listed like IFileTree: folders first, then case-insensitive by name
+    def _sorted(self) -> list["PathTreeEntry"]:
+        return sorted(
+            (self._children or {}).values(),
+            key=lambda entry: (entry.isFile(), entry._name.casefold()),
+        )
+
+    def __iter__(self):
+        return iter(self._sorted())
+
+    def __len__(self) -> int:
+        return len(self._children or {})
+
+    def __getitem__(self, index: int) -> "PathTreeEntry":
+        return self._sorted()[index]
+
+    def _root(self) -> "PathTreeEntry":
+        root = self
+        while root._parent is not None:
+            root = root._parent
+        return root
+
+    def _child(self, name: str) -> "PathTreeEntry | None":
+        for key, child in (self._children or {}).items():
+            if key.casefold() == name.casefold():
+                return child
+        return None
+
+    # Returns the folder at path (relative to this tree), creating it if needed
+    def _folder(self, path: str) -> "PathTreeEntry":
+        folder = self
+        for part in [p for p in path.replace("\\", "/").split("/") if p]:
+            child = folder._child(part)
+            if child is None:
+                child = PathTreeEntry(part, folder, None)
+                folder._children[part] = child
+            folder = child
+        return folder
+
+    def _detach(self) -> None:
+        if self._parent is not None:
+            del self._parent._children[self._name]
+            self._parent = None
+
+    def _attach(self, folder: "PathTreeEntry", name: str) -> None:
+        self._name = name
+        self._parent = folder
+        folder._children[name] = self
+
+    # IFileTree.move: a path ending in "/" moves into that folder, anything else
+    # is the new path of the entry. Fails (returns False) if the target exists.
+    def move(self, entry: "PathTreeEntry", path: str) -> bool:
+        path = path.replace("\\", "/")
+        if path.endswith("/"):
+            folder, name = self._folder(path), entry._name
+        else:
+            head, _, name = path.rpartition("/")
+            folder = self._folder(head)
+        if folder._child(name) is not None:
+            return False
+        entry._detach()
+        entry._attach(folder, name)
+        return True
 
+    def remove(self, entry: "PathTreeEntry") -> bool:
+        entry._detach()
+        return True
+
+    def path(self) -> str:
+        parts = []
+        entry = self
+        while entry._parent is not None:
+            parts.append(entry._name)
+            entry = entry._parent
+        return "/".join(reversed(parts))
+
+    # {archive member: final path} for every file left in the tree
+    def destinations(self) -> dict[str, str]:
+        result = {}
+        pending = [self]
+        while pending:
+            entry = pending.pop()
+            if entry.isFile():
+                result[entry.source] = entry.path()
+            else:
+                pending.extend(entry._children.values())
+        return result
+
+    @classmethod
+    def from_paths(cls, members: list[str]) -> "PathTreeEntry":
+        root = cls("", None, None)
+        for member in members:
+            head, _, name = member.replace("\\", "/").rstrip("/").rpartition("/")
+            folder = root._folder(head)
+            if name and folder._child(name) is None:
+                folder._children[name] = cls(name, folder, member)
+        return root
+
+
+class _GlobRules(BasicModDataChecker):
+    """The InzoiFilePatterns rules of BasicModDataChecker, applied to a
+    PathTreeEntry instead of an MO2 file tree."""
+
+    def dataLooksValid(self, filetree) -> mobase.ModDataChecker.CheckReturn:
+        status = self.VALID if len(filetree) else self.INVALID
+        for entry in filetree:
+            name = entry.name()
+            if _glob_match(name, InzoiFilePatterns["valid"]):
+                continue
+            if (
+                entry.isDir() and _glob_match(name, InzoiFilePatterns["unfold"])
+            ) or _glob_match(
+                name, [*InzoiFilePatterns["delete"], *InzoiFilePatterns["move"]]
+            ):
+                status = self.FIXABLE
+            else:
+                return self.INVALID
+        return status
+
+    def fix(self, filetree):
+        for entry in list(filetree):
+            name = entry.name()
+            if entry.isDir() and _glob_match(name, InzoiFilePatterns["unfold"]):
+                for child in list(entry):
+                    filetree.move(child, child.name())
+                filetree.remove(entry)
+            elif _glob_match(name, InzoiFilePatterns["delete"]):
+                filetree.remove(entry)
+            else:
+                for pattern, target in InzoiFilePatterns["move"].items():
+                    if fnmatch.fnmatch(name.lower(), pattern.lower()):
+                        filetree.move(entry, target.rstrip("/") + "/")
+                        break
         return filetree
 
 
-class InzoiGame(BasicGame):
+def _glob_match(name: str, patterns) -> bool:
+    return any(fnmatch.fnmatch(name.lower(), pattern.lower()) for pattern in patterns)
+
+
+class InstallPlanner(InzoiModDataChecker, _GlobRules):
+    """Runs the inZOI checker rules on a plain list of archive member paths.
+
+    The MRO puts _GlobRules where BasicModDataChecker would be, so the custom
+    steps of InzoiModDataChecker run unchanged on top of the glob rules.
+    """
+
+    # Returns the check result and {archive member: final path}; members that
+    # the rules delete are left out
+    def plan(
+        self, members: list[str]
+    ) -> tuple[mobase.ModDataChecker.CheckReturn, dict[str, str]]:
+        tree = PathTreeEntry.from_paths(members)
+        status = self.dataLooksValid(tree)
+        if status is self.FIXABLE:
+            tree = self.fix(tree)
+        return status, tree.destinations()
+
+
+# Formats a byte count for the log and report dialogs
+def format_size(num_bytes: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(num_bytes) < 1024:
+            return f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f} TB"
+
+
+# Loads a JSON cache file, falling back to the default if it is missing or corrupt
+def load_json(path: Path, default):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+    except (OSError, ValueError) as e:
+        logger.warning("⚠️ Ignoring unreadable cache file %s: %s", path, e)
+        return default
+
+
+# Writes a JSON cache file atomically so a crash never leaves a half-written index
+def save_json(path: Path, data) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+# Documents categories: mod folder → (Documents parent folder, emoji, log label)
+DocumentCategories = {
+    "My3DPrinter": ("AIGenerated", "🖨️", "3DPrinter"),
+    "MyAIMotions": ("AIGenerated", "🎭", "AIMotions"),
+    "MySites": ("Creations", "🏠", "MySites"),
+    "MyAppearances": ("Creations", "👤", "MyAppearances"),
+}
+
+
+class FsStats:
+    """Counts the filesystem calls made by the deploy and cleanup paths.
+
+    Call reset() before and snapshot() after an operation to benchmark it.
+    """
+
+    def __init__(self):
+        self.counts: dict[str, int] = {}
+
+    def count(self, call: str, amount: int = 1) -> None:
+        self.counts[call] = self.counts.get(call, 0) + amount
+
+    def reset(self) -> None:
+        self.counts = {}
+
+    def snapshot(self) -> dict[str, int]:
+        return dict(self.counts)
+
+    def __str__(self) -> str:
+        return ", ".join(
+            f"{count} {call}" for call, count in sorted(self.counts.items())
+        )
+
+
+fs_stats = FsStats()
+
+
+# Lists a directory once; DirEntry caches the entry type, so callers can test
+# is_dir()/is_symlink() without another stat. A missing directory is empty.
+def scan_dir(path: str | Path) -> list[os.DirEntry]:
+    fs_stats.count("scandir")
+    try:
+        with os.scandir(path) as it:
+            return list(it)
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+# Subfolders of path (following symlinks, as Path.is_dir() did)
+def scan_subdirs(path: str | Path) -> list[os.DirEntry]:
+    return [entry for entry in scan_dir(path) if entry.is_dir()]
+
+
+# {name: is_symlink} for every entry of a deploy target directory
+def scan_links(path: str | Path) -> dict[str, bool]:
+    return {entry.name: entry.is_symlink() for entry in scan_dir(path)}
+
+
+# Yields (relative posix path, DirEntry) for every file below path
+def walk_files(path: str | Path, relative: str = ""):
+    for entry in scan_dir(path):
+        entry_relative = f"{relative}{entry.name}"
+        if entry.is_dir(follow_symlinks=False):
+            yield from walk_files(entry.path, entry_relative + "/")
+        elif entry.is_file():
+            yield entry_relative, entry
+
+
+# Single lstat of a deploy target: None if missing, else whether it is a symlink
+def lstat_link(path: str | Path) -> bool | None:
+    fs_stats.count("lstat")
+    try:
+        return stat_module.S_ISLNK(os.lstat(path).st_mode)
+    except FileNotFoundError:
+        return None
+
+
+def make_dirs(path: Path) -> None:
+    fs_stats.count("mkdir")
+    path.mkdir(parents=True, exist_ok=True)
+
+
+def remove_link(path: str | Path) -> None:
+    fs_stats.count("unlink")
+    os.unlink(path)
+
+
+# Points target_base/name at source, replacing an existing symlink but never a
+# real file or folder. `existing` is the scan_links() map of target_base and is
+# kept up to date, so linking a whole folder costs one scandir instead of
+# several stat calls per link. Returns True if the link was created.
+def replace_dir_link(
+    source: str | Path, target_base: Path, name: str, existing: dict[str, bool]
+) -> bool:
+    target = target_base / name
+    if name in existing:
+        if not existing[name]:
+            logger.warning("⚠️ Skipping non-symlink existing path: %s", target)
+            return False
+        remove_link(target)
+        del existing[name]
+    fs_stats.count("symlink")
+    os.symlink(source, target, target_is_directory=True)
+    existing[name] = True
+    return True
+
+
+# Removes every symlink directly inside path, returns how many were removed
+def remove_dir_links(path: str | Path) -> int:
+    removed = 0
+    for entry in scan_dir(path):
+        if entry.is_symlink():
+            try:
+                remove_link(entry.path)
+                removed += 1
+                log_detail("🧹 Removed 🔗symlink: %s", entry.path)
+            except OSError as e:
+                logger.error("❌ Failed to remove symlink %s: %s", entry.path, e)
+    return removed
+
+
+# Points link at target with a single rename, so readers see either the old or
+# the new target and never a missing folder. Windows can't rename over a
+# directory link, so there the old link is moved aside first.
+def swap_link(link: Path, target: Path) -> None:
+    staged = link.with_name(link.name + ".swap")
+    if lstat_link(staged) is not None:
+        remove_link(staged)
+    fs_stats.count("symlink")
+    os.symlink(target, staged, target_is_directory=True)
+    fs_stats.count("rename")
+    try:
+        os.replace(staged, link)
+    except OSError:
+        retired = link.with_name(link.name + ".old")
+        os.replace(link, retired)
+        os.replace(staged, link)
+        remove_link(retired)
+
+
+# Cheap change marker for a mod's Documents content: the mtime of each category
+# folder changes whenever an MD5 folder is added, removed or renamed in it
+def mod_signature(mod_path: Path) -> list[int]:
+    signature = []
+    for category in DocumentCategories:
+        fs_stats.count("stat")
+        try:
+            signature.append(os.stat(mod_path / category).st_mtime_ns)
+        except OSError:
+            signature.append(0)
+    return signature
+
+
+def is_creation_id(name: str) -> bool:
+    return len(name) == 32 and all(c in "0123456789abcdef" for c in name.lower())
+
+
+class CreationRegistry:
+    """Persistent map of inZOI creation IDs (MD5 folder names) to their mods.
+
+    Each mod's IDs are stored with its mod_signature and only rescanned when
+    that changes. The reverse index answers "who provides this ID" in O(1).
+    """
+
+    def __init__(self, index_path: Path):
+        self.index_path = index_path
+        # mod name → {"signature": [...], "ids": {creation ID: category}}
+        self.mods: dict[str, dict] = load_json(index_path, {})
+        self.providers: dict[str, dict[str, str]] = {}
+        for mod_name, record in self.mods.items():
+            self._index(mod_name, record["ids"])
+        self.dirty = False
+
+    def _index(self, mod_name: str, ids: dict[str, str]) -> None:
+        for creation_id, category in ids.items():
+            self.providers.setdefault(creation_id, {})[mod_name] = category
+
+    def remove_mod(self, mod_name: str) -> None:
+        record = self.mods.pop(mod_name, None)
+        if not record:
+            return
+        for creation_id in record["ids"]:
+            providers = self.providers.get(creation_id, {})
+            providers.pop(mod_name, None)
+            if not providers:
+                self.providers.pop(creation_id, None)
+        self.dirty = True
+
+    # Rescans a mod if its category folders changed; returns its IDs
+    def update_mod(self, mod_name: str, mod_path: Path) -> dict[str, str]:
+        signature = mod_signature(mod_path)
+        record = self.mods.get(mod_name)
+        if record and record["signature"] == signature:
+            return record["ids"]
+        ids = {
+            folder.name.lower(): category
+            for category in DocumentCategories
+            for folder in scan_subdirs(mod_path / category)
+            if is_creation_id(folder.name)
+        }
+        self.remove_mod(mod_name)
+        self.mods[mod_name] = {"signature": signature, "ids": ids}
+        self._index(mod_name, ids)
+        self.dirty = True
+        return ids
+
+    # Brings the registry in line with the installed {mod name: path}
+    def sync(self, mods: dict[str, Path]) -> None:
+        for mod_name in set(self.mods) - set(mods):
+            self.remove_mod(mod_name)
+        for mod_name, mod_path in mods.items():
+            self.update_mod(mod_name, mod_path)
+
+    # {mod name: category} of every mod providing the ID
+    def lookup(self, creation_id: str) -> dict[str, str]:
+        return self.providers.get(creation_id.lower(), {})
+
+    # IDs of a mod that other mods provide too, with those other providers
+    def conflicts(self, mod_name: str) -> dict[str, dict[str, str]]:
+        conflicts = {}
+        for creation_id in self.mods.get(mod_name, {}).get("ids", {}):
+            others = {
+                other: category
+                for other, category in self.providers[creation_id].items()
+                if other != mod_name
+            }
+            if others:
+                conflicts[creation_id] = others
+        return conflicts
+
+    def save(self) -> None:
+        if self.dirty:
+            save_json(self.index_path, self.mods)
+            self.dirty = False
+
+
+class LinkFarm:
+    """Prebuilt Documents link folders for one MO2 profile.
+
+    Each category gets a farm folder holding one symlink per winning MD5 folder.
+    The Documents category folder itself becomes a symlink to the farm, so a
+    profile switch is one atomic swap. Farms are updated incrementally: only
+    the MD5 names provided by mods whose state, priority or content changed
+    are re-resolved. Whatever the game saves into a farm is moved to a shared
+    creations folder and linked into every profile's farm.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.state_path = root / "farm.json"
+        state = load_json(self.state_path, {})
+        # mod → {"path", "priority", "signature", "folders": {category: [names]}}
+        self.mods: dict[str, dict] = state.get("mods", {})
+        # category → {MD5 name: winning mod}
+        self.links: dict[str, dict[str, str]] = state.get("links", {})
+
+    def farm_dir(self, category: str) -> Path:
+        return self.root / category
+
+    # Shared by all profiles: creations the game saved while a farm was active
+    def creations_dir(self, category: str) -> Path:
+        return self.root.parent / UserCreationsFolderName / category
+
+    # Moves what the game saved into the farm the Documents folder points at
+    # (which may belong to another profile) to the shared creations folder
+    def harvest(self, category: str, documents_path: Path) -> int:
+        if not lstat_link(documents_path):
+            return 0
+        moved = 0
+        shared = self.creations_dir(category)
+        for entry in scan_dir(os.readlink(documents_path)):
+            if entry.is_symlink():
+                continue
+            make_dirs(shared)
+            target = shared / entry.name
+            is_dir = entry.is_dir()
+            shutil.move(entry.path, target)
+            fs_stats.count("symlink")
+            os.symlink(target, entry.path, target_is_directory=is_dir)
+            moved += 1
+        if moved:
+            logger.info("🔀 Kept %d in-game %s creations", moved, category)
+        return moved
+
+    # Links the shared creations into this profile's farm and drops links to
+    # creations that were moved back to Documents
+    def link_creations(self, category: str) -> None:
+        farm = self.farm_dir(category)
+        creations = {
+            entry.name: entry for entry in scan_dir(self.creations_dir(category))
+        }
+        mod_links = self.links.get(category, {})
+        existing = scan_links(farm)
+        for name, is_link in list(existing.items()):
+            if is_link and name not in mod_links and name not in creations:
+                remove_link(farm / name)
+                del existing[name]
+        for name, entry in creations.items():
+            if name not in existing:
+                fs_stats.count("symlink")
+                os.symlink(entry.path, farm / name, target_is_directory=entry.is_dir())
+
+    def save(self) -> None:
+        save_json(self.state_path, {"mods": self.mods, "links": self.links})
+
+    # Brings the farm in line with the active mods {name: (path, priority)}.
+    # Returns (links created, links removed).
+    def sync(self, active: dict[str, tuple[Path, int]]) -> tuple[int, int]:
+        changed: dict[str, tuple[Path, int] | None] = {
+            mod_name: None for mod_name in self.mods if mod_name not in active
+        }
+        for mod_name, (mod_path, priority) in active.items():
+            known = self.mods.get(mod_name)
+            if (
+                known is None
+                or known["path"] != str(mod_path)
+                or known["priority"] != priority
+                or known["signature"] != mod_signature(mod_path)
+            ):
+                changed[mod_name] = (mod_path, priority)
+        if not changed:
+            return 0, 0
+        return self.update(changed)
+
+    # Applies state changes for the given mods only: (path, priority) when
+    # active, None when disabled or removed
+    def update(self, changed: dict[str, tuple[Path, int] | None]) -> tuple[int, int]:
+        affected: dict[str, set[str]] = {
+            category: set() for category in DocumentCategories
+        }
+        for mod_name, active in changed.items():
+            previous = self.mods.pop(mod_name, None)
+            if previous:
+                for category, names in previous["folders"].items():
+                    affected[category].update(names)
+            if active is None:
+                continue
+            mod_path, priority = active
+            folders = {}
+            for category in DocumentCategories:
+                names = [entry.name for entry in scan_subdirs(mod_path / category)]
+                if names:
+                    folders[category] = names
+                    affected[category].update(names)
+            self.mods[mod_name] = {
+                "path": str(mod_path),
+                "priority": priority,
+                "signature": mod_signature(mod_path),
+                "folders": folders,
+            }
+
+        created = removed = 0
+        for category, names in affected.items():
+            if not names:
+                continue
+            providers: dict[str, list[str]] = {}
+            for mod_name, info in self.mods.items():
+                for name in info["folders"].get(category, []):
+                    if name in names:
+                        providers.setdefault(name, []).append(mod_name)
+
+            farm = self.farm_dir(category)
+            make_dirs(farm)
+            existing = scan_links(farm)
+            links = self.links.setdefault(category, {})
+            for name in names:
+                candidates = providers.get(name)
+                winner = (
+                    max(candidates, key=lambda mod: self.mods[mod]["priority"])
+                    if candidates
+                    else None
+                )
+                if winner is None:
+                    links.pop(name, None)
+                    if existing.get(name):
+                        remove_link(farm / name)
+                        removed += 1
+                    continue
+                if links.get(name) == winner and existing.get(name):
+                    continue
+                source = Path(self.mods[winner]["path"]) / category / name
+                try:
+                    if replace_dir_link(source, farm, name, existing):
+                        links[name] = winner
+                        created += 1
+                except OSError as e:
+                    logger.error("❌ Failed to link %s into the farm: %s", name, e)
+
+        self.save()
+        return created, removed
+
+    # Makes the Documents category folder point at this profile's farm
+    def activate(self, category: str, documents_path: Path) -> bool:
+        farm = self.farm_dir(category)
+        make_dirs(farm)
+        if lstat_link(documents_path) is False:
+            # A real folder: the player's own creations join the shared ones,
+            # leftover links go
+            entries = scan_dir(documents_path)
+            shared = self.creations_dir(category)
+            taken = {entry.name for entry in scan_dir(shared)}
+            if any(not entry.is_symlink() and entry.name in taken for entry in entries):
+                logger.warning(
+                    "⚠️ %s holds creations already kept for the link farms, using per-folder symlinks instead",
+                    documents_path,
+                )
+                return False
+            moved = 0
+            for entry in entries:
+                if entry.is_symlink():
+                    remove_link(entry.path)
+                    continue
+                make_dirs(shared)
+                shutil.move(entry.path, shared / entry.name)
+                moved += 1
+            if moved:
+                logger.info("🔀 Kept %d %s creations from Documents", moved, category)
+            os.rmdir(documents_path)
+        else:
+            make_dirs(documents_path.parent)
+            self.harvest(category, documents_path)
+        self.link_creations(category)
+        swap_link(documents_path, farm)
+        return True
+
+    # Turns the Documents category folder back into a real folder holding
+    # every creation the game saved into any profile's farm
+    def deactivate(self, category: str, documents_path: Path) -> None:
+        if not lstat_link(documents_path):
+            return
+        self.harvest(category, documents_path)
+        remove_link(documents_path)
+        make_dirs(documents_path)
+        for entry in scan_dir(self.creations_dir(category)):
+            shutil.move(entry.path, documents_path / entry.name)
+
+
+# Hashes a file in fixed-size chunks so large .ucas/.glb payloads never sit in memory
+def hash_file(path: str | Path) -> str:
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, "rb", buffering=0) as f:
+        buffer = bytearray(HashChunkSize)
+        view = memoryview(buffer)
+        while read := f.readinto(buffer):
+            digest.update(view[:read])
+    return digest.hexdigest()
+
+
+# Hash of the size, first and last chunk of a file. Enough to tell a patched
+# game pak from one that was only touched, without reading gigabytes.
+def hash_file_partial(path: str | Path) -> str:
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, "rb", buffering=0) as f:
+        size = f.seek(0, os.SEEK_END)
+        digest.update(size.to_bytes(8, "little"))
+        f.seek(0)
+        digest.update(f.read(HashChunkSize))
+        if size > HashChunkSize:
+            f.seek(max(HashChunkSize, size - HashChunkSize))
+            digest.update(f.read(HashChunkSize))
+    return digest.hexdigest()
+
+
+# Reads glTF binary metadata from the 12 byte header and the JSON chunk only.
+# The file is memory-mapped, so the (often huge) BIN chunk is never paged in.
+def read_glb_metadata(path: str | Path) -> dict:
+    metadata = {
+        "size": 0,
+        "meshes": 0,
+        "textures": 0,
+        "vertices": 0,
+        "error": None,
+    }
+    try:
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            metadata["size"] = size
+            if size < 20:
+                metadata["error"] = "file too small for a glTF binary header"
+                return metadata
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                magic, version, length = struct.unpack_from("<4sII", mm, 0)
+                if magic != b"glTF":
+                    metadata["error"] = f"bad magic {magic!r}"
+                    return metadata
+                if version != 2:
+                    metadata["error"] = f"unsupported glTF version {version}"
+                    return metadata
+                if length != size:
+                    metadata["error"] = f"header length {length} != file size {size}"
+                    return metadata
+
+                chunk_length, chunk_type = struct.unpack_from("<II", mm, 12)
+                if chunk_type != 0x4E4F534A:  # "JSON"
+                    metadata["error"] = "first chunk is not JSON"
+                    return metadata
+                if 20 + chunk_length > length:
+                    metadata["error"] = "JSON chunk runs past the end of the file"
+                    return metadata
+
+                gltf = json.loads(mm[20 : 20 + chunk_length])
+    except (OSError, ValueError, struct.error) as e:
+        metadata["error"] = str(e)
+        return metadata
+
+    if not isinstance(gltf, dict):
+        metadata["error"] = "JSON chunk is not an object"
+        return metadata
+    meshes = gltf.get("meshes", [])
+    accessors = gltf.get("accessors", [])
+    textures = gltf.get("textures", [])
+    if not all(isinstance(value, list) for value in (meshes, accessors, textures)):
+        metadata["error"] = "meshes, accessors and textures must be arrays"
+        return metadata
+
+    vertices = 0
+    for mesh in meshes:
+        primitives = mesh.get("primitives", []) if isinstance(mesh, dict) else None
+        if not isinstance(primitives, list):
+            metadata["error"] = "malformed mesh entry"
+            return metadata
+        for primitive in primitives:
+            attributes = (
+                primitive.get("attributes", {}) if isinstance(primitive, dict) else None
+            )
+            if not isinstance(attributes, dict):
+                metadata["error"] = "malformed mesh primitive"
+                return metadata
+            position = attributes.get("POSITION")
+            if isinstance(position, int) and 0 <= position < len(accessors):
+                accessor = accessors[position]
+                count = accessor.get("count", 0) if isinstance(accessor, dict) else None
+                if not isinstance(count, int):
+                    metadata["error"] = f"malformed accessor {position}"
+                    return metadata
+                vertices += count
+
+    metadata["meshes"] = len(meshes)
+    metadata["textures"] = len(textures)
+    metadata["vertices"] = vertices
+    return metadata
+
+
+# Category of a mod folder (relative posix path, "" for the mod root) for the
+# usage totals
+def usage_category(relative: str) -> str:
+    if relative.startswith(ModsPaksPath.as_posix() + "/"):
+        return "~mods paks"
+    top = relative.split("/", 1)[0]
+    return top if top in DocumentCategories else "Other"
+
+
+class ModUsageIndex:
+    """Persistent per-folder disk usage of the mods.
+
+    Each folder stores the mtime, bytes and file count of its direct files and
+    the names of its subfolders. On refresh a folder whose mtime is unchanged
+    costs a single stat; only changed folders are scanned again.
+    """
+
+    def __init__(self, index_path: Path):
+        self.index_path = index_path
+        self.index: dict[str, dict[str, list]] = load_json(index_path, {})
+
+    # Refreshes one folder and its subtree into folders; returns the number rescanned
+    def _refresh_dir(
+        self, path: str, relative: str, cached: dict[str, list], folders: dict
+    ) -> int:
+        fs_stats.count("stat")
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return 0
+        rescanned = 0
+        record = cached.get(relative)
+        if not record or record[0] != mtime:
+            size = count = 0
+            subdirs = []
+            for entry in scan_dir(path):
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.name)
+                elif entry.is_file(follow_symlinks=False):
+                    size += entry.stat(follow_symlinks=False).st_size
+                    count += 1
+            record = [mtime, size, count, subdirs]
+            rescanned = 1
+        folders[relative] = record
+        for name in record[3]:
+            rescanned += self._refresh_dir(
+                os.path.join(path, name), f"{relative}{name}/", cached, folders
+            )
+        return rescanned
+
+    # Brings the index up to date for {mod name: path}, one mod per worker.
+    # Returns (folders rescanned, folders total).
+    def refresh(self, mods: dict[str, Path]) -> tuple[int, int]:
+        def refresh_mod(mod_name: str) -> tuple[str, dict, int]:
+            folders: dict[str, list] = {}
+            rescanned = self._refresh_dir(
+                str(mods[mod_name]), "", self.index.get(mod_name, {}), folders
+            )
+            return mod_name, folders, rescanned
+
+        with ThreadPoolExecutor(max_workers=HashWorkers) as pool:
+            results = list(pool.map(refresh_mod, mods))
+        self.index = {mod_name: folders for mod_name, folders, _ in results}
+        save_json(self.index_path, self.index)
+        return (
+            sum(rescanned for _, _, rescanned in results),
+            sum(len(folders) for _, folders, _ in results),
+        )
+
+    # {mod name: {category: [bytes, files]}}
+    def totals(self) -> dict[str, dict[str, list[int]]]:
+        totals: dict[str, dict[str, list[int]]] = {}
+        for mod_name, folders in self.index.items():
+            categories = totals.setdefault(mod_name, {})
+            for relative, (_, size, count, _) in folders.items():
+                total = categories.setdefault(usage_category(relative), [0, 0])
+                total[0] += size
+                total[1] += count
+        return totals
+
+
+class GlbIndex:
+    """Persistent cache of .glb metadata keyed by absolute path, size and mtime."""
+
+    def __init__(self, index_path: Path):
+        self.index_path = index_path
+        self.index: dict[str, list] = load_json(index_path, {})
+        self.dirty = False
+
+    def get(self, path: Path) -> dict:
+        stat = path.stat()
+        key = str(path)
+        cached = self.index.get(key)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            return cached[2]
+        metadata = read_glb_metadata(path)
+        self.index[key] = [stat.st_size, stat.st_mtime_ns, metadata]
+        self.dirty = True
+        return metadata
+
+    def save(self) -> None:
+        if self.dirty:
+            save_json(self.index_path, self.index)
+            self.dirty = False
+
+    # Returns a list of (path, problem) for broken or oversized assets of one mod
+    def check_mod(self, mod_path: Path, max_size: int) -> list[tuple[Path, str]]:
+        problems: list[tuple[Path, str]] = []
+        printer_dir = mod_path / "My3DPrinter"
+        if not printer_dir.is_dir():
+            return problems
+
+        for glb in printer_dir.glob("*/*.glb"):
+            try:
+                metadata = self.get(glb)
+            except OSError as e:
+                problems.append((glb, str(e)))
+                continue
+            if metadata["error"]:
+                problems.append((glb, metadata["error"]))
+            elif max_size and metadata["size"] > max_size:
+                problems.append(
+                    (
+                        glb,
+                        f"{format_size(metadata['size'])} exceeds {format_size(max_size)} "
+                        f"({metadata['meshes']} meshes, {metadata['textures']} textures, "
+                        f"{metadata['vertices']} vertices)",
+                    )
+                )
+            else:
+                log_detail(
+                    "🖨️ %s: %s meshes, %s textures, %s vertices",
+                    glb.name,
+                    metadata["meshes"],
+                    metadata["textures"],
+                    metadata["vertices"],
+                )
+        return problems
+
+
+# Places src at dst as a hardlink when possible (same volume), otherwise as a symlink
+def link_file(src: Path, dst: Path) -> str:
+    try:
+        os.link(src, dst)
+        return "hardlink"
+    except OSError:
+        os.symlink(src, dst, target_is_directory=False)
+        return "symlink"
+
+
+# Sort key of a ~mods pak in the game's mount order: name order, with the _P
+# (patch) paks mounted after all others. Later paks override earlier ones.
+def pak_mount_key(relative: str) -> tuple[bool, str]:
+    stem = os.path.splitext(relative)[0].lower()
+    return stem.endswith("_p"), relative.lower()
+
+
+# Winning ~mods pak/utoc/ucas files as {relative path: source}, in MO2 priority order.
+# A container's files always come from the same mod: the highest priority mod
+# shipping a given stem wins the whole triplet.
+def winning_pak_files(mod_paths: list[tuple[str, Path]]) -> dict[str, Path]:
+    winners: dict[str, list[tuple[str, Path]]] = {}
+    for _, mod_path in mod_paths:
+        containers: dict[str, list[tuple[str, Path]]] = {}
+        for relative, entry in walk_files(mod_path / ModsPaksPath):
+            stem, extension = os.path.splitext(relative)
+            if extension.lower() in PakExtensions:
+                containers.setdefault(stem.lower(), []).append(
+                    (relative, Path(entry.path))
+                )
+        for stem, files in containers.items():
+            winners.pop(stem, None)
+            winners[stem] = files
+    return {relative: file for files in winners.values() for relative, file in files}
+
+
+# Names of the mods (given in priority order) that contribute nothing: every
+# file is overridden by a later mod, as the VFS resolves it, and every MD5
+# folder of a Documents category by a later link. Pak containers count as one
+# unit per stem, since the game mounts .pak/.utoc/.ucas together.
+def shadowed_mods(mod_paths: list[tuple[str, Path]]) -> list[str]:
+    paks_prefix = ModsPaksPath.as_posix().lower() + "/"
+    owners: dict[str, str] = {}
+    for mod_name, mod_path in mod_paths:
+        for entry in scan_dir(mod_path):
+            if entry.name in DocumentCategories and entry.is_dir():
+                for folder in scan_subdirs(entry.path):
+                    owners[f"{entry.name}/{folder.name}".lower()] = mod_name
+            elif entry.is_dir(follow_symlinks=False):
+                for relative, _ in walk_files(entry.path, entry.name + "/"):
+                    if relative.endswith(HiddenSuffix):
+                        continue
+                    key = relative.lower()
+                    stem, extension = os.path.splitext(key)
+                    if key.startswith(paks_prefix) and extension in PakExtensions:
+                        key = stem
+                    owners[key] = mod_name
+            elif entry.name != "meta.ini" and not entry.name.endswith(HiddenSuffix):
+                owners[entry.name.lower()] = mod_name
+    contributing = set(owners.values())
+    return [mod_name for mod_name, _ in mod_paths if mod_name not in contributing]
+
+
+# Writes a batch script that reads files sequentially. Run through MO2 it reads
+# them from whatever filesystem view (physical or VFS) the process gets.
+def write_read_script(script_path: Path, paths: list[Path]) -> None:
+    script_path.write_text(
+        "@echo off\n" + "".join(f'type "{path}" > NUL\n' for path in paths),
+        encoding="utf-8",
+    )
+
+
+class LaunchTracker:
+    """Persistent record of the links created and files hidden for a game run.
+
+    The manifest is written before the game starts, so a crash of MO2 or the
+    game never leaves stray links in the game folder: whatever is recorded is
+    undone on the next exit or plugin start.
+    """
+
+    def __init__(self, manifest_path: Path):
+        self.manifest_path = manifest_path
+        manifest = load_json(manifest_path, {})
+        self.links: list[str] = manifest.get("links", [])
+        self.hidden: list[list[str]] = manifest.get("hidden", [])
+
+    def add_link(self, path: Path) -> None:
+        self.links.append(str(path))
+
+    def add_hidden(self, original: Path, hidden: Path) -> None:
+        self.hidden.append([str(original), str(hidden)])
+
+    # Hides a file and records it; the manifest is saved before the rename
+    def hide(self, original: Path, hidden: Path) -> None:
+        self.add_hidden(original, hidden)
+        self.save()
+        try:
+            os.replace(original, hidden)
+        except OSError:
+            self.hidden.pop()
+            self.save()
+            raise
+
+    # Brings a hidden file back right away and forgets it
+    def unhide(self, original: Path, hidden: Path) -> None:
+        os.replace(hidden, original)
+        self.hidden.remove([str(original), str(hidden)])
+        self.save()
+
+    def save(self) -> None:
+        if self.links or self.hidden:
+            save_json(self.manifest_path, {"links": self.links, "hidden": self.hidden})
+        elif self.manifest_path.exists():
+            self.manifest_path.unlink()
+
+    # Removes every recorded link and restores every hidden file
+    def undo(self) -> tuple[int, int]:
+        removed = restored = 0
+        for link in self.links:
+            try:
+                os.unlink(link)
+                removed += 1
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.error("❌ Failed to remove tracked link %s: %s", link, e)
+        for original, hidden in self.hidden:
+            try:
+                os.replace(hidden, original)
+                restored += 1
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.error("❌ Failed to restore hidden file %s: %s", original, e)
+        self.links = []
+        self.hidden = []
+        self.save()
+        return removed, restored
+
+
+class GameUpdateDetector:
+    """Detects inZOI patches from the base game's paks.
+
+    The size and mtime of each base pak are compared with the last run, which
+    is all an unchanged game costs. Only files that differ are partially
+    hashed, so a file that was merely touched is not taken for an update.
+    """
+
+    def __init__(self, state_path: Path, paks_dir: Path):
+        self.state_path = state_path
+        self.paks_dir = paks_dir
+        self.state: dict = load_json(state_path, {})
+
+    # True if the game's paks changed since the last check
+    def check(self) -> bool:
+        known: dict[str, list] = self.state.get("files", {})
+        files: dict[str, list] = {}
+        changed = touched = False
+        updated_at = 0
+        for entry in scan_dir(self.paks_dir):
+            if not entry.is_file():
+                continue
+            stat = entry.stat()
+            record = known.get(entry.name)
+            if record and record[0] == stat.st_size and record[1] == stat.st_mtime_ns:
+                files[entry.name] = record
+                continue
+            touched = True
+            digest = hash_file_partial(entry.path)
+            if not record or record[2] != digest:
+                changed = True
+                updated_at = max(updated_at, stat.st_mtime_ns)
+            files[entry.name] = [stat.st_size, stat.st_mtime_ns, digest]
+        if set(known) - set(files):
+            changed = touched = True
+            updated_at = updated_at or time.time_ns()
+
+        if not touched:
+            return False
+        self.state["files"] = files
+        # The first check only records the game as it is
+        changed = changed and bool(known)
+        if changed:
+            self.state["updated_at"] = updated_at
+        save_json(self.state_path, self.state)
+        return changed
+
+    # Pak mods whose newest ~mods file predates the last game update
+    def outdated_mods(self, mod_paths: list[tuple[str, Path]]) -> list[str]:
+        updated_at = self.state.get("updated_at")
+        if not updated_at:
+            return []
+        outdated = []
+        for mod_name, mod_path in mod_paths:
+            newest = max(
+                (
+                    entry.stat().st_mtime_ns
+                    for relative, entry in walk_files(mod_path / ModsPaksPath)
+                    if os.path.splitext(relative)[1].lower() in PakExtensions
+                ),
+                default=None,
+            )
+            if newest is not None and newest < updated_at:
+                outdated.append(mod_name)
+        return outdated
+
+    def flagged(self) -> list[str]:
+        return self.state.get("flagged", [])
+
+    def set_flagged(self, mod_names: list[str]) -> None:
+        if mod_names != self.flagged():
+            self.state["flagged"] = mod_names
+            save_json(self.state_path, self.state)
+
+
+class PakConsolidator:
+    """Merges the winning entries of small legacy .pak mods into one generated pak.
+
+    When two mods ship the same pak name the higher priority one wins, as in
+    the VFS. The game then mounts the winning paks in name order, _P paks last.
+    Only the longest run of small paks that are adjacent in that order is
+    merged. The merged pak is deployed under the name of the run's first pak,
+    so it mounts exactly where the run sat and no unmerged pak changes sides.
+    Inside it, later paks in mount order overwrite earlier ones. IoStore paks
+    (with a .utoc/.ucas pair) are left alone since their container can't be
+    repacked into a plain pak. The unpack/pack work is delegated to an external
+    tool such as repak, configured through the "Pak Tool Path" setting.
+    """
+
+    def __init__(self, tool_path: str, work_dir: Path):
+        self.tool_path = tool_path
+        self.work_dir = work_dir
+        self.state_path = work_dir / PakMergeStateFileName
+        self.output_path = work_dir / "merged_paks" / PakMergeOutputName
+
+    # Returns (all winning ~mods paks, the run to merge in mount order, the
+    # ~mods relative path of the run's first pak, where the merged pak goes)
+    @staticmethod
+    def collect_inputs(
+        mod_paths: list[tuple[str, Path]],
+    ) -> tuple[list[Path], list[tuple[str, Path]], str]:
+        winners: dict[str, tuple[str, str, Path]] = {}
+        io_store: set[str] = set()
+        for mod_name, mod_path in mod_paths:
+            files = list(walk_files(mod_path / ModsPaksPath))
+            stems = {
+                os.path.splitext(relative)[0].lower()
+                for relative, _ in files
+                if relative.lower().endswith((".utoc", ".ucas"))
+            }
+            for relative, entry in files:
+                if not relative.lower().endswith(".pak"):
+                    continue
+                key = relative.lower()
+                winners[key] = (mod_name, relative, Path(entry.path))
+                if key[:-4] in stems:
+                    io_store.add(entry.path)
+
+        mounted = sorted(winners.values(), key=lambda winner: pak_mount_key(winner[1]))
+        best: list[tuple[str, str, Path]] = []
+        run: list[tuple[str, str, Path]] = []
+        for winner in mounted:
+            pak = winner[2]
+            if str(pak) in io_store or pak.stat().st_size > PakMergeMaxFileSize:
+                run = []
+                continue
+            run.append(winner)
+            if len(run) > len(best):
+                best = list(run)
+
+        all_paks = [pak for _, _, pak in mounted]
+        inputs = [(mod_name, pak) for mod_name, _, pak in best]
+        return all_paks, inputs, best[0][1] if best else ""
+
+    @staticmethod
+    def fingerprint(tool_path: str, inputs: list[tuple[str, Path]]) -> str:
+        digest = hashlib.sha1(tool_path.encode("utf-8"))
+        for mod_name, pak in inputs:
+            stat = pak.stat()
+            digest.update(
+                f"{mod_name}|{pak}|{stat.st_size}|{stat.st_mtime_ns}\n".encode()
+            )
+        return digest.hexdigest()
+
+    def _run_tool(self, template: list[str], **kwargs: str) -> None:
+        args = [self.tool_path, *(arg.format(**kwargs) for arg in template)]
+        log_detail("📦 Running pak tool: %s", " ".join(args))
+        subprocess.run(
+            args,
+            check=True,
+            capture_output=True,
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+        )
+
+    # Builds the merged pak unless the inputs are unchanged since the last build.
+    # Returns the benchmark numbers for the log.
+    def build(self, inputs: list[tuple[str, Path]], force: bool = False) -> dict:
+        started = time.perf_counter()
+        fingerprint = self.fingerprint(self.tool_path, inputs)
+        state = load_json(self.state_path, {})
+        stats = {"inputs": len(inputs), "rebuilt": False, "seconds": 0.0}
+
+        if (
+            not force
+            and state.get("fingerprint") == fingerprint
+            and self.output_path.exists()
+        ):
+            stats["seconds"] = time.perf_counter() - started
+            return stats
+
+        staging = self.work_dir / "merged_paks_staging"
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir(parents=True)
+        try:
+            # Unpack lowest priority first so higher priority entries overwrite
+            for _, pak in inputs:
+                self._run_tool(PakUnpackArgs, input=str(pak), output=str(staging))
+            self.output_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_output = self.output_path.with_name(self.output_path.name + ".tmp")
+            self._run_tool(PakPackArgs, input=str(staging), output=str(tmp_output))
+            os.replace(tmp_output, self.output_path)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+        save_json(
+            self.state_path,
+            {
+                "fingerprint": fingerprint,
+                "inputs": [[mod_name, str(pak)] for mod_name, pak in inputs],
+            },
+        )
+        stats["rebuilt"] = True
+        stats["seconds"] = time.perf_counter() - started
+        return stats
+
+
+# Reads an Unreal FString (int32 length incl. terminator, negative for UTF-16)
+def _read_fstring(data: bytes, offset: int) -> tuple[str, int]:
+    (length,) = struct.unpack_from("<i", data, offset)
+    offset += 4
+    if length == 0:
+        return "", offset
+    if length < 0:
+        size = -length * 2
+        text = data[offset : offset + size - 2].decode("utf-16-le")
+    else:
+        size = length
+        text = data[offset : offset + size - 1].decode("utf-8", "replace")
+    if offset + size > len(data):
+        raise ValueError("string runs past the end of the header")
+    return text, offset + size
+
+
+# Parses the GVAS header every Unreal SaveGame starts with, from the first few KB only
+def read_save_header(path: str | Path) -> dict:
+    try:
+        with open(path, "rb") as f:
+            data = f.read(SaveHeaderReadSize)
+        if data[:4] != b"GVAS":
+            return {"error": "not an Unreal save (missing GVAS magic)"}
+        save_version, package_version = struct.unpack_from("<ii", data, 4)
+        offset = 12
+        header = {"save_version": save_version, "package_version": package_version}
+        if save_version >= 3:  # UE5 saves add the UE5 package version
+            (header["package_version_ue5"],) = struct.unpack_from("<i", data, offset)
+            offset += 4
+        major, minor, patch, changelist = struct.unpack_from("<HHHI", data, offset)
+        offset += 10
+        branch, offset = _read_fstring(data, offset)
+        header["engine"] = f"{major}.{minor}.{patch}-{changelist}"
+        header["branch"] = branch
+        return header
+    except (OSError, ValueError, struct.error, UnicodeDecodeError) as e:
+        return {"error": str(e)}
+
+
+# Opens an inner .zip of an outer archive, closed with the stack. A compressed
+# member is spooled to a temporary file first: every backward seek in it would
+# decompress it again from the start.
+def open_inner_zip(
+    zf: zipfile.ZipFile, info: zipfile.ZipInfo, stack: ExitStack
+) -> zipfile.ZipFile:
+    raw = stack.enter_context(zf.open(info))
+    if info.compress_type != zipfile.ZIP_STORED:
+        spool = stack.enter_context(tempfile.TemporaryFile())
+        shutil.copyfileobj(raw, spool, HashChunkSize)
+        spool.seek(0)
+        raw = spool
+    return stack.enter_context(zipfile.ZipFile(raw))
+
+
+# Lists the files of a zip with inner .zip archives expanded in place: the
+# members of "Wrapper/Mod.zip" are listed under "Wrapper/". Only the inner
+# central directories are read. Returns ({listed path: size}, {listed path:
+# (inner archive, inner member)} for the files that come from inner archives).
+def list_nested_zip(
+    zf: zipfile.ZipFile,
+) -> tuple[dict[str, int], dict[str, tuple[str, str]]]:
+    files: dict[str, int] = {}
+    nested: dict[str, tuple[str, str]] = {}
+    for info in zf.infolist():
+        if info.is_dir():
+            continue
+        if not info.filename.lower().endswith(".zip"):
+            files[info.filename] = info.file_size
+            continue
+        prefix = info.filename[: info.filename.rfind("/") + 1]
+        try:
+            with ExitStack() as stack:
+                inner = open_inner_zip(zf, info, stack)
+                for inner_info in inner.infolist():
+                    if not inner_info.is_dir():
+                        files[prefix + inner_info.filename] = inner_info.file_size
+                        nested[prefix + inner_info.filename] = (
+                            info.filename,
+                            inner_info.filename,
+                        )
+        except zipfile.BadZipFile:
+            files[info.filename] = info.file_size
+    return files, nested
+
+
+class ArchivePlan:
+    """Classification result for one archive of a batch install."""
+
+    def __init__(self, archive: Path):
+        self.archive = archive
+        self.status: mobase.ModDataChecker.CheckReturn | None = None
+        self.destinations: dict[str, str] = {}
+        # listed path → (inner archive, inner member) for nested archives
+        self.nested: dict[str, tuple[str, str]] = {}
+        self.total_bytes = 0
+        self.mod_path: Path | None = None
+        self.seconds = 0.0
+        self.error: str | None = None
+
+
+class BatchArchiveInstaller:
+    """Installs many .zip mod archives at once.
+
+    Listing and classification run in a thread pool (reading a zip central
+    directory is I/O bound), extraction runs with a bounded number of
+    concurrent archives, and each archive is laid out with the same rules as
+    InzoiModDataChecker via InstallPlanner. Inner .zip archives are listed and
+    extracted through the outer one, without unpacking them to disk first.
+    """
+
+    def __init__(self, workers: int = HashWorkers, io_workers: int = 4):
+        self.workers = workers
+        self.io_workers = io_workers
+
+    @staticmethod
+    def classify(archive: Path) -> ArchivePlan:
+        plan = ArchivePlan(archive)
+        try:
+            with zipfile.ZipFile(archive) as zf:
+                files, plan.nested = list_nested_zip(zf)
+            plan.total_bytes = sum(files.values())
+            plan.status, plan.destinations = InstallPlanner().plan(list(files))
+            if plan.status is mobase.ModDataChecker.INVALID:
+                plan.error = "no valid inZOI mod layout found"
+        except (OSError, zipfile.BadZipFile) as e:
+            plan.error = str(e)
+        return plan
+
+    def classify_all(self, archives: list[Path]) -> list[ArchivePlan]:
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            return list(pool.map(self.classify, archives))
+
+    # Streams every kept member straight to its corrected path: one read and
+    # one write per file, no intermediate layout, no rename or cleanup pass
+    @staticmethod
+    def extract(plan: ArchivePlan) -> ArchivePlan:
+        started = time.perf_counter()
+        root = os.path.realpath(plan.mod_path)
+        created_dirs: set[str] = set()
+        inner_archives: dict[str, zipfile.ZipFile] = {}
+        try:
+            with zipfile.ZipFile(plan.archive) as zf, ExitStack() as stack:
+                for member, destination in plan.destinations.items():
+                    target = os.path.realpath(os.path.join(root, destination))
+                    if not target.startswith(root + os.sep):
+                        logger.warning(
+                            "⚠️ Skipping %s: path escapes the mod folder", member
+                        )
+                        continue
+                    parent = os.path.dirname(target)
+                    if parent not in created_dirs:
+                        os.makedirs(parent, exist_ok=True)
+                        created_dirs.add(parent)
+                    if member in plan.nested:
+                        archive_member, inner_member = plan.nested[member]
+                        if archive_member not in inner_archives:
+                            inner_archives[archive_member] = open_inner_zip(
+                                zf, zf.getinfo(archive_member), stack
+                            )
+                        source = inner_archives[archive_member].open(inner_member)
+                    else:
+                        source = zf.open(member)
+                    with source as src, open(target, "wb") as dst:
+                        shutil.copyfileobj(src, dst, HashChunkSize)
+        except (OSError, zipfile.BadZipFile) as e:
+            plan.error = str(e)
+        plan.seconds = time.perf_counter() - started
+        return plan
+
+    def extract_all(self, plans: list[ArchivePlan]) -> list[ArchivePlan]:
+        with ThreadPoolExecutor(max_workers=self.io_workers) as pool:
+            return list(pool.map(self.extract, plans))
+
+
+class InzoiSaveGame(BasicGameSaveGame):
+    """Savegame backed by the cached index entry instead of fresh stat calls."""
+
+    def __init__(self, filepath: Path, metadata: dict):
+        super().__init__(filepath)
+        self.metadata = metadata
+
+    def getCreationTime(self) -> QDateTime:
+        return QDateTime.fromMSecsSinceEpoch(self.metadata["mtime_ns"] // 1_000_000)
+
+
+class SaveGameIndex:
+    """Persistent per-save metadata (size, mtime, GVAS header fields).
+
+    A refresh is one scandir per folder; headers are only re-read for saves
+    whose size or mtime changed, so large SaveGames folders list instantly.
+    """
+
+    def __init__(self, index_path: Path):
+        self.index_path = index_path
+        self.saves: dict[str, dict] = load_json(index_path, {})
+
+    # Returns [(path, metadata)] for every .sav under folder, updating the index
+    def refresh(self, folder: Path) -> list[tuple[Path, dict]]:
+        prefix = str(folder) + os.sep
+        seen: dict[str, dict] = {}
+        changed = 0
+        pending = [str(folder)]
+        while pending:
+            current = pending.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                            continue
+                        if not entry.name.lower().endswith(".sav"):
+                            continue
+                        stat = entry.stat()
+                        cached = self.saves.get(entry.path)
+                        if (
+                            cached
+                            and cached["size"] == stat.st_size
+                            and cached["mtime_ns"] == stat.st_mtime_ns
+                        ):
+                            seen[entry.path] = cached
+                            continue
+                        seen[entry.path] = {
+                            "size": stat.st_size,
+                            "mtime_ns": stat.st_mtime_ns,
+                            "header": read_save_header(entry.path),
+                        }
+                        changed += 1
+            except FileNotFoundError:
+                continue
+
+        removed = [
+            path for path in self.saves if path.startswith(prefix) and path not in seen
+        ]
+        if changed or removed:
+            for path in removed:
+                del self.saves[path]
+            self.saves.update(seen)
+            save_json(self.index_path, self.saves)
+            log_detail(
+                "💾 Save index: %s updated, %s removed, %s total",
+                changed,
+                len(removed),
+                len(seen),
+            )
+
+        return [(Path(path), metadata) for path, metadata in seen.items()]
+
+
+class SaveSnapshotStore:
+    """Incremental, deduplicated SaveGames snapshots.
+
+    Every save file is stored once, zlib-compressed, under its content hash.
+    A snapshot is a small manifest of {relative path: [size, mtime, hash]};
+    files whose size and mtime match the previous snapshot are not even read.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.objects = root / "objects"
+
+    def _profile_dir(self, profile_name: str) -> Path:
+        return self.root / "snapshots" / profile_name
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects / digest[:2] / digest
+
+    # Snapshot manifests of a profile, newest first
+    def list(self, profile_name: str) -> list[Path]:
+        return sorted(
+            (
+                Path(entry.path)
+                for entry in scan_dir(self._profile_dir(profile_name))
+                if entry.name.endswith(".json")
+            ),
+            reverse=True,
+        )
+
+    # Compresses a file into the store; returns the number of bytes written
+    def _store(self, path: str, digest: str) -> int:
+        target = self._object_path(digest)
+        if target.exists():
+            return 0
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = target.with_name(target.name + ".tmp")
+        compressor = zlib.compressobj(6)
+        written = 0
+        with open(path, "rb") as src, open(tmp_path, "wb") as dst:
+            while chunk := src.read(HashChunkSize):
+                data = compressor.compress(chunk)
+                dst.write(data)
+                written += len(data)
+            data = compressor.flush()
+            dst.write(data)
+            written += len(data)
+        os.replace(tmp_path, target)
+        return written
+
+    def take(self, profile_name: str, folder: Path) -> dict:
+        started = time.perf_counter()
+        snapshots = self.list(profile_name)
+        previous = load_json(snapshots[0], {}).get("files", {}) if snapshots else {}
+
+        files: dict[str, list] = {}
+        stats = {"files": 0, "changed": 0, "bytes_written": 0, "full_size": 0}
+        for relative, entry in walk_files(folder):
+            stat = entry.stat()
+            stats["files"] += 1
+            stats["full_size"] += stat.st_size
+            known = previous.get(relative)
+            if known and known[0] == stat.st_size and known[1] == stat.st_mtime_ns:
+                files[relative] = known
+                continue
+            digest = hash_file(entry.path)
+            stats["bytes_written"] += self._store(entry.path, digest)
+            stats["changed"] += 1
+            files[relative] = [stat.st_size, stat.st_mtime_ns, digest]
+
+        stats["snapshot"] = None
+        if files and (files != previous or not snapshots):
+            # Microseconds keep names unique and in order within one second
+            stamp = time.strftime("%Y%m%d-%H%M%S")
+            micros = time.time_ns() // 1000 % 1_000_000
+            while (
+                path := self._profile_dir(profile_name) / f"{stamp}-{micros:06d}.json"
+            ).exists():
+                micros += 1
+            manifest = {"created": time.time(), "folder": str(folder), "files": files}
+            save_json(path, manifest)
+            stats["snapshot"] = path.name
+        stats["seconds"] = time.perf_counter() - started
+        return stats
+
+    # Files of a snapshot; raises ValueError if it is missing, empty or refers
+    # to objects that are no longer in the store
+    def load(self, snapshot: Path) -> dict[str, list]:
+        files = load_json(snapshot, {}).get("files")
+        if not files:
+            raise ValueError(f"save snapshot {snapshot.name} is missing or empty")
+        for _, _, digest in files.values():
+            if not self._object_path(digest).is_file():
+                raise ValueError(f"save snapshot {snapshot.name} is incomplete")
+        return files
+
+    # Restores a snapshot exactly: changed files are rewritten, files that
+    # were created after the snapshot are removed. Nothing is touched unless
+    # the snapshot is complete.
+    def restore(self, snapshot: Path, folder: Path) -> int:
+        files = self.load(snapshot)
+        restored = 0
+        for relative, entry in walk_files(folder):
+            if relative not in files:
+                os.unlink(entry.path)
+        for relative, (size, mtime_ns, digest) in files.items():
+            target = folder / relative
+            try:
+                stat = target.stat()
+                if stat.st_size == size and stat.st_mtime_ns == mtime_ns:
+                    continue
+            except FileNotFoundError:
+                target.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = target.with_name(target.name + ".restore")
+            decompressor = zlib.decompressobj()
+            with open(self._object_path(digest), "rb") as src, open(
+                tmp_path, "wb"
+            ) as dst:
+                while chunk := src.read(HashChunkSize):
+                    dst.write(decompressor.decompress(chunk))
+                dst.write(decompressor.flush())
+            os.replace(tmp_path, target)
+            os.utime(target, ns=(mtime_ns, mtime_ns))
+            restored += 1
+        return restored
+
+    # Keeps the newest snapshots of a profile (and the protected ones) and
+    # drops unreferenced objects
+    def prune(self, profile_name: str, keep: int, protect: tuple[str, ...] = ()) -> int:
+        for snapshot in self.list(profile_name)[keep:]:
+            if snapshot.name not in protect:
+                snapshot.unlink()
+        referenced = set()
+        for profile in scan_subdirs(self.root / "snapshots"):
+            for snapshot in self.list(profile.name):
+                for _, _, digest in load_json(snapshot, {}).get("files", {}).values():
+                    referenced.add(digest)
+        removed = 0
+        for bucket in scan_subdirs(self.objects):
+            for entry in scan_dir(bucket.path):
+                if entry.name not in referenced:
+                    os.unlink(entry.path)
+                    removed += 1
+        return removed
+
+
+# Names of the mods enabled ("+Name") in any profile's modlist.txt
+def profile_active_mods(profiles_dir: Path) -> set[str]:
+    active: set[str] = set()
+    for profile in scan_subdirs(profiles_dir):
+        try:
+            with open(os.path.join(profile.path, "modlist.txt"), encoding="utf-8") as f:
+                active.update(
+                    line[1:].rstrip("\r\n") for line in f if line.startswith("+")
+                )
+        except OSError:
+            continue
+    return active
+
+
+class ColdStorage:
+    """Compressed archives of mods that stayed disabled in every profile.
+
+    Each archived mod becomes one zip in the store and keeps only its meta.ini
+    in the mods folder, so MO2 still lists it. The index remembers since when
+    every mod has been seen disabled everywhere and what was archived.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.index_path = root / ColdStorageIndexFileName
+        index = load_json(self.index_path, {})
+        self.archived: dict[str, dict] = index.get("archived", {})
+        self.inactive_since: dict[str, float] = index.get("inactive_since", {})
+        # Archive workers record their mods one by one
+        self._lock = threading.Lock()
+
+    def _archive_path(self, mod_name: str) -> Path:
+        return self.root / f"{mod_name}.zip"
+
+    def is_archived(self, mod_name: str) -> bool:
+        return mod_name in self.archived
+
+    # Records when each mod was first seen disabled in every profile
+    def observe(self, mod_names: list[str], active: set[str]) -> None:
+        now = time.time()
+        self.inactive_since = {
+            mod_name: self.inactive_since.get(mod_name, now)
+            for mod_name in mod_names
+            if mod_name not in active
+        }
+
+    def candidates(self, mod_names: list[str], days: int) -> list[str]:
+        cutoff = time.time() - days * 86400
+        return [
+            mod_name
+            for mod_name in mod_names
+            if not self.is_archived(mod_name)
+            and self.inactive_since.get(mod_name, time.time()) <= cutoff
+        ]
+
+    # Moves everything but meta.ini of a mod into its archive. The index entry
+    # is saved before any file is deleted, so a crash never orphans an archive.
+    def archive(self, mod_name: str, mod_path: Path) -> dict:
+        files = [
+            (relative, entry)
+            for relative, entry in walk_files(mod_path)
+            if relative != "meta.ini"
+        ]
+        if not files:
+            return {}
+        record = {
+            "archived_at": time.time(),
+            "files": len(files),
+            "bytes": sum(entry.stat().st_size for _, entry in files),
+        }
+        target = self._archive_path(mod_name)
+        tmp_path = target.with_name(target.name + ".tmp")
+        with zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            for relative, entry in files:
+                zf.write(entry.path, relative)
+        os.replace(tmp_path, target)
+        record["stored_bytes"] = target.stat().st_size
+        with self._lock:
+            self.archived[mod_name] = record
+            self.save()
+        try:
+            for entry in scan_dir(mod_path):
+                if entry.name == "meta.ini":
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+        except OSError:
+            # Never leave a half-removed mod behind
+            self.rehydrate(mod_name, mod_path)
+            with self._lock:
+                self.archived.pop(mod_name, None)
+                self.save()
+            raise
+        return record
+
+    # Archives {mod name: path} in parallel; returns {mod name: record or error}
+    def archive_all(self, mods: dict[str, Path]) -> dict[str, dict | str]:
+        def archive_mod(mod_name: str) -> tuple[str, dict | str]:
+            try:
+                return mod_name, self.archive(mod_name, mods[mod_name])
+            except (OSError, zipfile.BadZipFile) as e:
+                target = self._archive_path(mod_name)
+                target.with_name(target.name + ".tmp").unlink(missing_ok=True)
+                return mod_name, str(e)
+
+        with ThreadPoolExecutor(max_workers=HashWorkers) as pool:
+            return dict(pool.map(archive_mod, mods))
+
+    def rehydrate(self, mod_name: str, mod_path: Path) -> float:
+        started = time.perf_counter()
+        archive = self._archive_path(mod_name)
+        with zipfile.ZipFile(archive) as zf:
+            zf.extractall(mod_path)
+        archive.unlink()
+        return time.perf_counter() - started
+
+    # Restores {mod name: path} in parallel; returns {mod name: seconds or error}
+    def rehydrate_all(self, mods: dict[str, Path]) -> dict[str, float | str]:
+        def rehydrate_mod(mod_name: str) -> tuple[str, float | str]:
+            try:
+                return mod_name, self.rehydrate(mod_name, mods[mod_name])
+            except (OSError, zipfile.BadZipFile) as e:
+                return mod_name, str(e)
+
+        with ThreadPoolExecutor(max_workers=HashWorkers) as pool:
+            results = dict(pool.map(rehydrate_mod, mods))
+        for mod_name, seconds in results.items():
+            if isinstance(seconds, float):
+                self.archived.pop(mod_name, None)
+        self.save()
+        return results
+
+    # Forgets a mod removed from MO2, archive included, so a new mod with the
+    # same name is never overwritten by the old one's files
+    def discard(self, mod_name: str) -> None:
+        self._archive_path(mod_name).unlink(missing_ok=True)
+        self.archived.pop(mod_name, None)
+        self.inactive_since.pop(mod_name, None)
+        self.save()
+
+    def save(self) -> None:
+        save_json(
+            self.index_path,
+            {"archived": self.archived, "inactive_since": self.inactive_since},
+        )
+
+
+class ModDeduplicator:
+    """Finds identical payloads across mod folders and optionally hardlinks them
+    into a content-addressed store.
+
+    Files are only hashed when another file of the exact same size exists, and
+    hashes are cached by relative path, size and mtime so repeated passes only
+    read new or changed files. Duplicates are replaced by hardlinks, so the mod
+    folders keep their layout and the deployers never notice the difference.
+    """
+
+    def __init__(self, mods_path: Path, store_path: Path, index_path: Path):
+        self.mods_path = mods_path
+        self.store_path = store_path
+        self.index_path = index_path
+        self.index: dict[str, list] = load_json(index_path, {})
+
+    # Walks every mod folder and returns {relative path: stat result} for candidate files
+    def _collect_files(self) -> dict[str, os.stat_result]:
+        files: dict[str, os.stat_result] = {}
+        pending = [self.mods_path]
+        while pending:
+            current = pending.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(Path(entry.path))
+                        elif entry.is_file(follow_symlinks=False):
+                            if entry.name.lower() == "meta.ini":
+                                continue
+                            stat = entry.stat(follow_symlinks=False)
+                            if stat.st_size >= DedupMinFileSize:
+                                relative = os.path.relpath(entry.path, self.mods_path)
+                                files[relative] = stat
+            except OSError as e:
+                logger.warning("⚠️ Cannot scan %s: %s", current, e)
+        return files
+
+    # Returns the cached hash for a file, or None if it has to be (re)hashed
+    def _cached_hash(self, relative: str, stat: os.stat_result) -> str | None:
+        cached = self.index.get(relative)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            return cached[2]
+        return None
+
+    # Groups duplicate files by content hash: {hash: [relative paths]}
+    def find_duplicates(self) -> dict[str, list[str]]:
+        started = time.perf_counter()
+        files = self._collect_files()
+
+        # Size pre-filter: a file with a unique size cannot have a duplicate
+        by_size: dict[int, list[str]] = {}
+        for relative, stat in files.items():
+            by_size.setdefault(stat.st_size, []).append(relative)
+        candidates = [
+            relative
+            for group in by_size.values()
+            if len(group) > 1
+            for relative in group
+        ]
+
+        hashes: dict[str, str] = {}
+        to_hash: list[str] = []
+        for relative in candidates:
+            cached = self._cached_hash(relative, files[relative])
+            if cached:
+                hashes[relative] = cached
+            else:
+                to_hash.append(relative)
+
+        def _hash(relative: str) -> tuple[str, str | None]:
+            try:
+                return relative, hash_file(self.mods_path / relative)
+            except OSError as e:
+                logger.warning("⚠️ Failed to hash %s: %s", relative, e)
+                return relative, None
+
+        with ThreadPoolExecutor(max_workers=HashWorkers) as pool:
+            for relative, digest in pool.map(_hash, to_hash):
+                if digest:
+                    hashes[relative] = digest
+
+        # Only keep index entries for files that still exist
+        self.index = {
+            relative: [files[relative].st_size, files[relative].st_mtime_ns, digest]
+            for relative, digest in hashes.items()
+        }
+        save_json(self.index_path, self.index)
+
+        groups: dict[str, list[str]] = {}
+        for relative, digest in hashes.items():
+            groups.setdefault(digest, []).append(relative)
+        duplicates = {
+            digest: sorted(paths) for digest, paths in groups.items() if len(paths) > 1
+        }
+
+        logger.info(
+            "🔍 Dedup scan: %s files, %s size matches, %s hashed, %s duplicate groups in %.2fs",
+            len(files),
+            len(candidates),
+            len(to_hash),
+            len(duplicates),
+            time.perf_counter() - started,
+        )
+        return duplicates
+
+    # Bytes that would be freed by hardlinking, ignoring files that already share an inode
+    def reclaimable_bytes(self, duplicates: dict[str, list[str]]) -> int:
+        total = 0
+        for paths in duplicates.values():
+            inodes: set[tuple[int, int]] = set()
+            size = 0
+            for relative in paths:
+                try:
+                    stat = os.stat(self.mods_path / relative)
+                except OSError:
+                    continue
+                inodes.add((stat.st_dev, stat.st_ino))
+                size = stat.st_size
+            total += size * max(len(inodes) - 1, 0)
+        return total
+
+    # Replaces every duplicate with a hardlink to its content-addressed store object
+    def hardlink_duplicates(self, duplicates: dict[str, list[str]]) -> int:
+        linked = 0
+        for digest, paths in duplicates.items():
+            store_file = self.store_path / digest[:2] / digest
+            try:
+                if not store_file.exists():
+                    store_file.parent.mkdir(parents=True, exist_ok=True)
+                    os.link(self.mods_path / paths[0], store_file)
+            except OSError as e:
+                logger.error("❌ Failed to add %s to the store: %s", paths[0], e)
+                continue
+
+            for relative in paths:
+                file_path = self.mods_path / relative
+                tmp_path = file_path.with_name(file_path.name + ".dedup-tmp")
+                try:
+                    if os.path.samefile(file_path, store_file):
+                        continue
+                    os.link(store_file, tmp_path)
+                    # Atomic swap: the file is never missing for a deployer or the VFS
+                    os.replace(tmp_path, file_path)
+                    linked += 1
+                    log_detail("🔗 Hardlinked %s → %s", relative, digest)
+                except OSError as e:
+                    logger.error("❌ Failed to hardlink %s: %s", relative, e)
+                    if tmp_path.exists():
+                        tmp_path.unlink()
+
+            # Keep the index valid: the hardlink carries the store object's mtime
+            stat = store_file.stat()
+            for relative in paths:
+                self.index[relative] = [stat.st_size, stat.st_mtime_ns, digest]
+
+        save_json(self.index_path, self.index)
+        return linked
+
+    # Removes store objects that no mod folder links to anymore
+    def prune_store(self) -> int:
+        removed = 0
+        if not self.store_path.is_dir():
+            return removed
+        for bucket in os.scandir(self.store_path):
+            if not bucket.is_dir(follow_symlinks=False):
+                continue
+            for entry in os.scandir(bucket.path):
+                try:
+                    # DirEntry.stat() reports st_nlink as 0 on Windows
+                    if os.lstat(entry.path).st_nlink <= 1:
+                        os.unlink(entry.path)
+                        removed += 1
+                except OSError as e:
+                    logger.warning(
+                        "⚠️ Failed to prune store object %s: %s", entry.path, e
+                    )
+        return removed
+
+
+class InzoiGame(BasicGame, mobase.IPluginFileMapper):
     Name = "inZOI Support Plugin"
     Author = "Frog"
     Version = "2.0.0"
@@ -542,6 +2689,11 @@ class InzoiGame(BasicGame):
     GameDataPath = "%GAME_PATH%"
     GameDocumentsDirectory = "%DOCUMENTS%/inZOI"
     GameSavesDirectory = "%GAME_DOCUMENTS%/SaveGames"
+    GameSaveExtension = "sav"
+
+    def __init__(self):
+        super().__init__()
+        mobase.IPluginFileMapper.__init__(self)
 
     def init(self, organizer: IOrganizer) -> bool:
         if not super().init(organizer):
@@ -551,21 +2703,99 @@ class InzoiGame(BasicGame):
         organizer.onAboutToRun(self._onAboutToRun)
         organizer.onFinishedRun(self._onFinishedRun)
         organizer.onPluginSettingChanged(self._settings_change_callback)
-        # Not really doing anything with this right now.
-        # self._register_feature(BasicLocalSavegames(self.savesDirectory()))
+        self._register_feature(BasicLocalSavegames(self.savesDirectory()))
         self._organizer = organizer
+        global LogLevel
+        LogLevel = self.loglevel
+        start_async_logging()
         modList = self._organizer.modList()
         modList.onModStateChanged(self.mod_state_changed)
+        modList.onModInstalled(self._onModInstalled)
+        modList.onModRemoved(self._onModRemoved)
+        organizer.onProfileChanged(self._onProfileChanged)
+        organizer.onUserInterfaceInitialized(self._onUserInterfaceInitialized)
+        # Undo whatever a crashed session left behind in the game folder
+        self._launch_tracker().undo()
         return True
 
+    # Plugin setting, unless forced while benchmarking the Documents deployment
+    # modes
+    def _documents_setting(self, setting: str) -> bool:
+        forced = getattr(self, "_forced_settings", {})
+        if setting in forced:
+            return forced[setting]
+        return self._organizer.pluginSetting(self.name(), setting)
+
     @property
     def deploy_symlinkmods(self) -> bool:
-        return self._organizer.pluginSetting(self.name(), SymLinkSettingsName)
+        return self._documents_setting(SymLinkSettingsName)
+
+    @property
+    def use_link_farms(self) -> bool:
+        return self._documents_setting(LinkFarmSettingsName)
+
+    @property
+    def map_documents_vfs(self) -> bool:
+        return self._documents_setting(VfsMappingSettingsName)
+
+    @property
+    def persistent_deployment(self) -> bool:
+        return self._documents_setting(PersistentDeploySettingsName)
+
+    @property
+    def skip_shadowed_mods(self) -> bool:
+        return self._organizer.pluginSetting(self.name(), SkipShadowedSettingsName)
+
+    @property
+    def snapshot_saves(self) -> bool:
+        return self._organizer.pluginSetting(self.name(), SnapshotSettingsName)
+
+    @property
+    def glb_max_size(self) -> int:
+        megabytes = self._organizer.pluginSetting(self.name(), GlbMaxSizeSettingsName)
+        return int(megabytes or 0) * 1024 * 1024
+
+    @property
+    def cold_storage_days(self) -> int:
+        return int(
+            self._organizer.pluginSetting(self.name(), ColdStorageSettingsName) or 0
+        )
+
+    @property
+    def merge_small_paks(self) -> bool:
+        return self._organizer.pluginSetting(self.name(), PakMergeSettingsName)
+
+    @property
+    def deploy_paks_physically(self) -> bool:
+        return self._organizer.pluginSetting(self.name(), PakDeploySettingsName)
+
+    @property
+    def pak_tool_path(self) -> str:
+        return str(
+            self._organizer.pluginSetting(self.name(), PakToolSettingsName) or ""
+        )
 
     @property
     def loglevel(self) -> bool:
         return self._organizer.pluginSetting(self.name(), "LogLevel").capitalize()
 
+    # Folder for the plugin's persistent indexes, kept per MO2 instance
+    def _cache_dir(self) -> Path:
+        cache_dir = Path(self._organizer.basePath()) / CacheFolderName
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        return cache_dir
+
+    # Content-addressed store, next to the mods folder so hardlinks stay on one volume
+    def _store_dir(self) -> Path:
+        return Path(self._organizer.modsPath()).parent / StoreFolderName
+
+    def _cold_storage(self) -> ColdStorage:
+        if getattr(self, "_cold_storage_cache", None) is None:
+            self._cold_storage_cache = ColdStorage(
+                Path(self._organizer.modsPath()).parent / ColdStorageFolderName
+            )
+        return self._cold_storage_cache
+
     def executables(self):
         return [
             mobase.ExecutableInfo(
@@ -605,517 +2835,1303 @@ class InzoiGame(BasicGame):
 
         return efls
 
+    # Documents target folder of a category, e.g. <Documents>/AIGenerated/My3DPrinter
+    def _category_base(self, category: str) -> Path:
+        parent = DocumentCategories[category][0]
+        return Path(self.documentsDirectory().absolutePath()) / parent / category
+
     def mod_state_changed(self, mod_states: dict[str, mobase.ModState]):
-        printer_base = (
-            Path(self.documentsDirectory().absolutePath())
-            / "AIGenerated"
-            / "My3DPrinter"
-        )
-        motions_base = (
-            Path(self.documentsDirectory().absolutePath())
-            / "AIGenerated"
-            / "MyAIMotions"
-        )
-        site_base = (
-            Path(self.documentsDirectory().absolutePath()) / "Creations" / "MySites"
-        )
-        appearance_base = (
-            Path(self.documentsDirectory().absolutePath())
-            / "Creations"
-            / "MyAppearances"
+        self._rehydrate_mods(
+            [
+                mod_name
+                for mod_name, state in mod_states.items()
+                if state & mobase.ModState.ACTIVE
+            ]
         )
-        printer_base.mkdir(parents=True, exist_ok=True)
-        motions_base.mkdir(parents=True, exist_ok=True)
-        site_base.mkdir(parents=True, exist_ok=True)
-        appearance_base.mkdir(parents=True, exist_ok=True)
+        enabled = disabled = created = removed = 0
+        bases = {
+            category: self._category_base(category) for category in DocumentCategories
+        }
+        for base in bases.values():
+            make_dirs(base)
+        # MD5 names provided by the mods in this batch, per category
+        affected: dict[str, set[str]] = {
+            category: set() for category in DocumentCategories
+        }
+        # While the game runs, deploy-on-launch links are applied live and tracked
+        # for removal at exit, unless they are kept between runs
+        live = self.deploy_symlinkmods and getattr(self, "_game_running", False)
+        tracker = self._launch_tracker()
 
         for mod_name, state in mod_states.items():
             mod = self._organizer.modList().getMod(mod_name)
             if not mod:
-                logger.warning(f"🧐 Mod not found: {mod_name}")
+                logger.warning("🧐 Mod not found: %s", mod_name)
                 continue
 
+            active = bool(state & mobase.ModState.ACTIVE)
+            if active:
+                log_detail("✔️ %s enabled.", mod_name)
+                enabled += 1
+            else:
+                log_detail("➖ %s disabled.", mod_name)
+                disabled += 1
+
+            if (
+                (self.deploy_symlinkmods and not live)
+                or self.use_link_farms
+                or self.map_documents_vfs
+            ):
+                continue  # skip symlink handling and extra logging
+
             mod_path = Path(mod.absolutePath())
-            printer_source_dir = mod_path / "My3DPrinter"
-            motions_source_dir = mod_path / "MyAIMotions"
-            site_source_dir = mod_path / "MySites"
-            appearance_source_dir = mod_path / "MyAppearances"
-
-            if state & mobase.ModState.ACTIVE:
-                logger.info(f"✔️ {mod_name} enabled.")
-
-                if self.deploy_symlinkmods:
-                    continue  # skip symlink handling and extra logging
-
-                if printer_source_dir.is_dir():
-                    logger.info(f"🖨️ {mod_name} is a 3DPrinter mod!")
-                    for folder in printer_source_dir.iterdir():
-                        if folder.is_dir():
-                            target_dir = printer_base / folder.name
-                            if target_dir.exists():
-                                if target_dir.is_symlink():
-                                    target_dir.unlink()
-                                else:
-                                    logger.warning(
-                                        f"⚠️ Skipping existing non-symlink: {target_dir}"
-                                    )
-                                    continue
-                            try:
-                                os.symlink(folder, target_dir, target_is_directory=True)
-                                logger.info(
-                                    f"Created 🖨️ 3DPrinter 🔗 symlink: {target_dir} → {folder}"
-                                )
-                            except Exception as e:
-                                logger.error(
-                                    f"❌ Failed to create 🖨️ symlink for {mod_name}: {e}"
-                                )
+            for category, (_, emoji, label) in DocumentCategories.items():
+                folders = scan_subdirs(mod_path / category)
+                if not folders:
+                    continue
+                log_detail("%s %s is a %s mod!", emoji, mod_name, label)
+                affected[category].update(folder.name for folder in folders)
 
-                if motions_source_dir.is_dir():
-                    logger.info(f"🎭 {mod_name} is a AIMotions mod!")
-                    for folder in motions_source_dir.iterdir():
-                        if folder.is_dir():
-                            target_dir = motions_base / folder.name
-                            if target_dir.exists():
-                                if target_dir.is_symlink():
-                                    target_dir.unlink()
-                                else:
-                                    logger.warning(
-                                        f"⚠️ Skipping existing non-symlink: {target_dir}"
-                                    )
-                                    continue
-                            try:
-                                os.symlink(folder, target_dir, target_is_directory=True)
-                                logger.info(
-                                    f"Created 🎭 AIMotions 🔗 symlink: {target_dir} → {folder}"
-                                )
-                            except Exception as e:
-                                logger.error(
-                                    f"❌ Failed to create 🎭 symlink for {mod_name}: {e}"
-                                )
+        # Re-resolve every touched MD5 name among the active mods, so the highest
+        # priority provider keeps the link whichever mod changed
+        for category, names in affected.items():
+            if not names:
+                continue
+            _, emoji, label = DocumentCategories[category]
+            winners: dict[str, str] = {}
+            for _, mod_path in self._launch_mod_paths():
+                for folder in scan_subdirs(mod_path / category):
+                    if folder.name in names:
+                        winners[folder.name] = folder.path
+            base = bases[category]
+            links = scan_links(base)
+            for name in names:
+                target = base / name
+                source = winners.get(name)
+                try:
+                    if source is None:
+                        if links.get(name):
+                            remove_link(target)
+                            del links[name]
+                            log_detail(
+                                "🧹 Removed %s %s 🔗 symlink: %s", emoji, label, target
+                            )
+                            removed += 1
+                        continue
+                    if links.get(name) and Path(os.readlink(target)) == Path(source):
+                        continue
+                    if replace_dir_link(source, base, name, links):
+                        log_detail(
+                            "Created %s %s 🔗 symlink: %s → %s",
+                            emoji,
+                            label,
+                            target,
+                            source,
+                        )
+                        created += 1
+                        if live and not self.persistent_deployment:
+                            tracker.add_link(target)
+                except OSError as e:
+                    logger.error(
+                        "❌ Failed to update %s symlink %s: %s", emoji, name, e
+                    )
 
-                if site_source_dir.is_dir():
-                    logger.info(f"🎭 {mod_name} is a MySites mod!")
-                    for folder in site_source_dir.iterdir():
-                        if folder.is_dir():
-                            target_dir = site_base / folder.name
-                            if target_dir.exists():
-                                if target_dir.is_symlink():
-                                    target_dir.unlink()
-                                else:
-                                    logger.warning(
-                                        f"⚠️ Skipping existing non-symlink: {target_dir}"
-                                    )
-                                    continue
-                            try:
-                                os.symlink(folder, target_dir, target_is_directory=True)
-                                logger.info(
-                                    f"Created 🏠 MySites 🔗 symlink: {target_dir} → {folder}"
-                                )
-                            except Exception as e:
-                                logger.error(
-                                    f"❌ Failed to create 🏠 symlink for {mod_name}: {e}"
-                                )
+        if live:
+            tracker.save()
+            # Links kept between runs changed, so redeploy fully on next launch
+            if self.persistent_deployment and (created or removed):
+                self._forget_deployment()
 
-                if appearance_source_dir.is_dir():
-                    logger.info(f"👤 {mod_name} is a MyAppearances mod!")
-                    for folder in appearance_source_dir.iterdir():
-                        if folder.is_dir():
-                            target_dir = appearance_base / folder.name
-                            if target_dir.exists():
-                                if target_dir.is_symlink():
-                                    target_dir.unlink()
-                                else:
-                                    logger.warning(
-                                        f"⚠️ Skipping existing non-symlink: {target_dir}"
-                                    )
-                                    continue
-                            try:
-                                os.symlink(folder, target_dir, target_is_directory=True)
-                                logger.info(
-                                    f"Created 👤 MyAppearances 🔗 symlink: {target_dir} → {folder}"
-                                )
-                            except Exception as e:
-                                logger.error(
-                                    f"❌ Failed to create 👤 symlink for {mod_name}: {e}"
-                                )
+        registry = self._creation_registry()
+        for mod_name in mod_states:
+            mod = self._organizer.modList().getMod(mod_name)
+            if mod:
+                registry.update_mod(mod_name, Path(mod.absolutePath()))
+        registry.save()
+
+        if self.use_link_farms:
+            mod_list = self._organizer.modList()
+            changed = {}
+            for mod_name, state in mod_states.items():
+                mod = mod_list.getMod(mod_name)
+                if mod and state & mobase.ModState.ACTIVE:
+                    changed[mod_name] = (
+                        Path(mod.absolutePath()),
+                        mod_list.priority(mod_name),
+                    )
+                else:
+                    changed[mod_name] = None
+            created, removed = self._link_farm().update(changed)
 
-            else:
-                logger.info(f"➖ {mod_name} disabled.")
-
-                if self.deploy_symlinkmods:
-                    continue  # skip symlink removal and extra logging
-
-                if printer_source_dir.is_dir():
-                    logger.info(f"🖨️ {mod_name} is a 3DPrinter mod!")
-                    for folder in printer_source_dir.iterdir():
-                        if folder.is_dir():
-                            target_dir = printer_base / folder.name
-                            if target_dir.exists() and target_dir.is_symlink():
-                                try:
-                                    target_dir.unlink()
-                                    logger.info(
-                                        f"🧹 Removed 🖨️ 3DPrinter 🔗 symlink: {target_dir} for {mod_name}"
-                                    )
-                                except Exception as e:
-                                    logger.error(
-                                        f"❌ Failed to remove 🖨️ symlink for {mod_name}: {e}"
-                                    )
-
-                if motions_source_dir.is_dir():
-                    logger.info(f"🎭 {mod_name} is a AIMotions mod!")
-                    for folder in motions_source_dir.iterdir():
-                        if folder.is_dir():
-                            target_dir = motions_base / folder.name
-                            if target_dir.exists() and target_dir.is_symlink():
-                                try:
-                                    target_dir.unlink()
-                                    logger.info(
-                                        f"🧹 Removed 🎭 AIMotions 🔗 symlink: {target_dir} for {mod_name}"
-                                    )
-                                except Exception as e:
-                                    logger.error(
-                                        f"❌ Failed to remove 🎭 symlink for {mod_name}: {e}"
-                                    )
-
-                if site_source_dir.is_dir():
-                    logger.info(f"🎭 {mod_name} is a AIMotions mod!")
-                    for folder in site_source_dir.iterdir():
-                        if folder.is_dir():
-                            target_dir = site_base / folder.name
-                            if target_dir.exists() and target_dir.is_symlink():
-                                try:
-                                    target_dir.unlink()
-                                    logger.info(
-                                        f"🧹 Removed 🏠 MySites 🔗 symlink: {target_dir} for {mod_name}"
-                                    )
-                                except Exception as e:
-                                    logger.error(
-                                        f"❌ Failed to remove 🏠 symlink for {mod_name}: {e}"
-                                    )
-
-                if appearance_source_dir.is_dir():
-                    logger.info(f"👤 {mod_name} is a MyAppearances mod!")
-                    for folder in appearance_source_dir.iterdir():
-                        if folder.is_dir():
-                            target_dir = appearance_base / folder.name
-                            if target_dir.exists() and target_dir.is_symlink():
-                                try:
-                                    target_dir.unlink()
-                                    logger.info(
-                                        f"🧹 Removed 👤 MyAppearances 🔗 symlink: {target_dir} for {mod_name}"
-                                    )
-                                except Exception as e:
-                                    logger.error(
-                                        f"❌ Failed to remove 👤 symlink for {mod_name}: {e}"
-                                    )
+        if mod_states:
+            logger.info(
+                "🔄 Mod state changed%s: %d enabled, %d disabled, %d 🔗symlinks created, %d removed",
+                " (live, game running)" if live else "",
+                enabled,
+                disabled,
+                created,
+                removed,
+            )
 
     def AddBitfixSymlinksOnLaunch(self):
-        mods_parent_path = Path(self._organizer.modsPath())
-        modlist = self._organizer.modList().allModsByProfilePriority()
-
-        for mod in modlist:
-            if self._organizer.modList().state(mod) & mobase.ModState.ACTIVE:
-                mod_path = mods_parent_path / mod
-                for file_name in ["bitfix", "dsound.dll"]:
-                    file_src = (
-                        mod_path / "BlueClient" / "Binaries" / "Win64" / file_name
-                    )
-                    if file_src.exists():
-                        file_dst = (
-                            Path(self.gameDirectory().absolutePath())
-                            / "BlueClient"
-                            / "Binaries"
-                            / "Win64"
-                            / file_name
+        created = removed = 0
+        target_base = (
+            Path(self.gameDirectory().absolutePath())
+            / "BlueClient"
+            / "Binaries"
+            / "Win64"
+        )
+        existing = scan_links(target_base)
+
+        for mod_name, mod_path in self._launch_mod_paths():
+            sources = {
+                entry.name: entry
+                for entry in scan_dir(mod_path / "BlueClient" / "Binaries" / "Win64")
+            }
+            for file_name in ["bitfix", "dsound.dll"]:
+                if file_name not in sources:
+                    continue
+                file_src = sources[file_name].path
+                file_dst = target_base / file_name
+                if file_name in existing:
+                    # Only remove if it's a symlink
+                    if existing[file_name]:
+                        log_detail("🧹 Removing existing 🔗symlink: %s", file_dst)
+                        remove_link(file_dst)
+                        del existing[file_name]
+                        removed += 1
+                    else:
+                        log_detail(
+                            "Skipping removal of file or directory: %s", file_dst
                         )
-                        if file_dst.exists():
-                            logger.info(
-                                f"Checking existing 🔗symlink or file: {file_dst}"
-                            )
-                            # Only remove if it's a symlink
-                            if file_dst.is_symlink():
-                                logger.info(
-                                    f"🧹 Removing existing 🔗symlink: {file_dst}"
-                                )
-                                file_dst.unlink()
-                            else:
-                                logger.info(
-                                    f"Skipping removal of file or directory: {file_dst}"
-                                )
-                        try:
-                            logger.info(f"Creating 🔗symlink: {file_dst} → {file_src}")
-                            os.symlink(file_src, file_dst, target_is_directory=False)
-                        except Exception as e:
-                            logger.error(
-                                f"❌Failed to create 🔗symlink for {file_src}: {e}"
-                            )
+                try:
+                    log_detail("Creating 🔗symlink: %s → %s", file_dst, file_src)
+                    fs_stats.count("symlink")
+                    os.symlink(file_src, file_dst, target_is_directory=False)
+                    existing[file_name] = True
+                    created += 1
+                except Exception as e:
+                    logger.error("❌Failed to create 🔗symlink for %s: %s", file_src, e)
+
+        if created or removed:
+            logger.info(
+                "🔗 Bitfix: %d symlinks created, %d stale symlinks replaced",
+                created,
+                removed,
+            )
 
     def RemoveBitfixSymlinksOnExit(self):
-        modlist = self._organizer.modList().allModsByProfilePriority()
-
-        for mod in modlist:
-            if self._organizer.modList().state(mod) & mobase.ModState.ACTIVE:
-                for file_name in ["bitfix", "dsound.dll"]:
-                    file_dst = (
-                        Path(self.gameDirectory().absolutePath())
-                        / "BlueClient"
-                        / "Binaries"
-                        / "Win64"
-                        / file_name
-                    )
-                    if file_dst.is_symlink():
-                        logger.info(f"🧹 Removing 🔗symlink: {file_dst}")
-                        file_dst.unlink()
-
-    def Add3DPrinterSymlinksOnLaunch(self):
-        printer_base = (
-            Path(self.documentsDirectory().absolutePath())
-            / "AIGenerated"
-            / "My3DPrinter"
+        removed = 0
+        target_base = (
+            Path(self.gameDirectory().absolutePath())
+            / "BlueClient"
+            / "Binaries"
+            / "Win64"
+        )
+        for entry in scan_dir(target_base):
+            if entry.name in ("bitfix", "dsound.dll") and entry.is_symlink():
+                log_detail("🧹 Removing 🔗symlink: %s", entry.path)
+                remove_link(entry.path)
+                removed += 1
+
+        if removed:
+            logger.info("🧹 Bitfix: removed %d 🔗symlinks", removed)
+
+    def AddPakLinksOnLaunch(self):
+        created = skipped = 0
+        tracker = self._launch_tracker()
+        target_base = Path(self.gameDirectory().absolutePath()) / ModsPaksPath
+        # NTFS is case-insensitive; dangling links (not listed as files) are
+        # caught by the lstat below
+        existing = {relative.lower() for relative, _ in walk_files(target_base)}
+
+        for relative, source in winning_pak_files(self._launch_mod_paths()).items():
+            target = target_base / relative
+            if relative.lower() in existing or lstat_link(target) is not None:
+                log_detail("⚠️ Skipping existing game file: %s", target)
+                skipped += 1
+                continue
+            # Hide the mod copy from the VFS first, so reads hit the physical link
+            hidden = source.with_name(source.name + HiddenSuffix)
+            try:
+                tracker.hide(source, hidden)
+            except OSError as e:
+                logger.error("❌ Failed to hide pak %s: %s", relative, e)
+                continue
+            try:
+                if target.parent != target_base:
+                    make_dirs(target.parent)
+                kind = link_file(hidden, target)
+            except OSError as e:
+                # Without the link the game would not see the pak at all
+                logger.error("❌ Failed to deploy pak %s: %s", relative, e)
+                try:
+                    tracker.unhide(source, hidden)
+                except OSError as e:
+                    logger.error("❌ Failed to restore hidden pak %s: %s", source, e)
+                continue
+            tracker.add_link(target)
+            tracker.save()
+            created += 1
+            log_detail("📦 Deployed pak %s: %s → %s", kind, target, source)
+
+        logger.info(
+            "📦 Deployed %d pak files physically into ~mods (%d skipped)",
+            created,
+            skipped,
         )
-        printer_base.mkdir(parents=True, exist_ok=True)
 
-        modlist = self._organizer.modList().allModsByProfilePriority()
-        for mod_name in modlist:
-            if self._organizer.modList().state(mod_name) & mobase.ModState.ACTIVE:
-                mod = self._organizer.modList().getMod(mod_name)
-                if not mod:
-                    continue
+    def _link_farm(self, profile_name: str | None = None) -> LinkFarm:
+        profile_name = profile_name or self._organizer.profileName()
+        cached = getattr(self, "_link_farm_cache", None)
+        if cached is None or cached.root.name != profile_name:
+            cached = LinkFarm(self._cache_dir() / LinkFarmFolderName / profile_name)
+            self._link_farm_cache = cached
+        return cached
+
+    # Updates the current profile's farms and points the Documents categories
+    # at them. Returns the categories that could not be switched to a farm.
+    def ActivateLinkFarms(self, profile_name: str | None = None) -> list[str]:
+        started = time.perf_counter()
+        farm = self._link_farm(profile_name)
+        mod_list = self._organizer.modList()
+        active = {
+            mod_name: (mod_path, mod_list.priority(mod_name))
+            for mod_name, mod_path in self._launch_mod_paths()
+        }
+        created, removed = farm.sync(active)
+        fallback = [
+            category
+            for category in DocumentCategories
+            if not farm.activate(category, self._category_base(category))
+        ]
+        logger.info(
+            "🔀 Activated link farms for %s: %d links created, %d removed in %.3fs",
+            farm.root.name,
+            created,
+            removed,
+            time.perf_counter() - started,
+        )
+        return fallback
+
+    def DeactivateLinkFarms(self):
+        farm = self._link_farm()
+        for category in DocumentCategories:
+            farm.deactivate(category, self._category_base(category))
+        logger.info("🔀 Deactivated link farms for %s", farm.root.name)
+
+    # Fingerprint of everything the Documents deployment depends on: the active
+    # mods, their priority order and the mtimes of their category folders
+    def _deployment_fingerprint(self) -> str:
+        digest = hashlib.sha1(self._organizer.profileName().encode("utf-8"))
+        for mod_name, mod_path in self._launch_mod_paths():
+            digest.update(f"{mod_name}|{mod_path}|{mod_signature(mod_path)}\n".encode())
+        return digest.hexdigest()
+
+    # A few deployed links and their targets, re-checked before a fast launch
+    def _deployment_sample(self) -> list[list[str]]:
+        sample: list[list[str]] = []
+        per_category = DeploymentSpotCheckSize // len(DocumentCategories)
+        for category in DocumentCategories:
+            links = [
+                entry
+                for entry in scan_dir(self._category_base(category))
+                if entry.is_symlink()
+            ]
+            for entry in links[:per_category]:
+                sample.append([entry.path, os.readlink(entry.path)])
+        return sample
+
+    # True if the links deployed on a previous run can be kept as they are
+    def _deployment_unchanged(self, fingerprint: str) -> bool:
+        state = load_json(self._cache_dir() / DeploymentStateFileName, {})
+        if state.get("fingerprint") != fingerprint:
+            return False
+        for link, target in state.get("sample", []):
+            try:
+                fs_stats.count("readlink")
+                if os.readlink(link) != target or not os.path.isdir(link):
+                    return False
+            except OSError:
+                return False
+        return True
 
-                mod_path = Path(mod.absolutePath())
-                source_dir = mod_path / "My3DPrinter"
+    def _forget_deployment(self):
+        state_path = self._cache_dir() / DeploymentStateFileName
+        if state_path.exists():
+            state_path.unlink()
+
+    # Deploys the Documents categories, skipping all of it when the persistent
+    # deployment from the last run still matches the active mods
+    def _deploy_documents_on_launch(self):
+        fingerprint = ""
+        if self.persistent_deployment:
+            started = time.perf_counter()
+            fingerprint = self._deployment_fingerprint()
+            if self._deployment_unchanged(fingerprint):
+                logger.info(
+                    "⚡ Active mods unchanged, keeping deployed links (checked in %.3fs)",
+                    time.perf_counter() - started,
+                )
+                return
+            # Something changed: start from a clean slate so stale links go away
+            for category in DocumentCategories:
+                remove_dir_links(self._category_base(category))
+
+        self.Add3DPrinterSymlinksOnLaunch()
+        self.AddAIMotionsSymlinksOnLaunch()
+        self.AddMySitesSymlinksOnLaunch()
+        self.AddMyAppearancesSymlinksOnLaunch()
+
+        if self.persistent_deployment:
+            save_json(
+                self._cache_dir() / DeploymentStateFileName,
+                {"fingerprint": fingerprint, "sample": self._deployment_sample()},
+            )
 
-                if not source_dir.is_dir():
-                    continue
+    def _onProfileChanged(self, old: mobase.IProfile, new: mobase.IProfile):
+        self._rehydrate_mods([mod_name for mod_name, _ in self._active_mod_paths()])
+        if self.use_link_farms and new is not None:
+            self.ActivateLinkFarms(new.name())
+
+    # Links every MD5 folder of a category from the active mods, in priority order
+    def _add_category_symlinks(self, category: str) -> int:
+        created = 0
+        _, emoji, label = DocumentCategories[category]
+        base = self._category_base(category)
+        make_dirs(base)
+        existing = scan_links(base)
+
+        for _, mod_path in self._launch_mod_paths():
+            for folder in scan_subdirs(mod_path / category):
+                try:
+                    if replace_dir_link(folder.path, base, folder.name, existing):
+                        log_detail(
+                            "Created %s 🔗symlink: %s → %s",
+                            label,
+                            base / folder.name,
+                            folder.path,
+                        )
+                        created += 1
+                except OSError as e:
+                    logger.error("❌ Failed to create %s symlink: %s", label, e)
 
-                for actual_mod_folder in source_dir.iterdir():
-                    if actual_mod_folder.is_dir():
-                        target_dir = printer_base / actual_mod_folder.name
-                        if target_dir.exists():
-                            if target_dir.is_symlink():
-                                target_dir.unlink()
-                            else:
-                                logger.warning(
-                                    f"⚠️ Skipping non-symlink existing path: {target_dir}"
-                                )
-                                continue
-                        try:
-                            os.symlink(
-                                actual_mod_folder, target_dir, target_is_directory=True
-                            )
-                            logger.info(
-                                f"Created 3DPrinter 🔗symlink: {target_dir} → {actual_mod_folder}"
-                            )
-                        except Exception as e:
-                            logger.error(f"❌ Failed to create 3DPrinter symlink: {e}")
+        logger.info("%s Created %d %s 🔗symlinks", emoji, created, label)
+        return created
 
-    def Remove3DPrinterSymlinksOnExit(self):
-        printer_base = (
-            Path(self.documentsDirectory().absolutePath())
-            / "AIGenerated"
-            / "My3DPrinter"
+    def _remove_category_symlinks(self, category: str) -> int:
+        removed = remove_dir_links(self._category_base(category))
+        logger.info(
+            "🧹 Removed %d %s 🔗symlinks", removed, DocumentCategories[category][2]
         )
+        return removed
+
+    def Add3DPrinterSymlinksOnLaunch(self):
+        self._add_category_symlinks("My3DPrinter")
 
-        if printer_base.exists():
-            for child in printer_base.iterdir():
-                if child.is_symlink():
-                    try:
-                        child.unlink()
-                        logger.info(f"🧹 Removed 3DPrinter 🔗symlink: {child}")
-                    except Exception as e:
-                        logger.error(f"❌ Failed to remove 3DPrinter symlink: {e}")
+    def Remove3DPrinterSymlinksOnExit(self):
+        self._remove_category_symlinks("My3DPrinter")
 
     def AddAIMotionsSymlinksOnLaunch(self):
-        motions_base = (
-            Path(self.documentsDirectory().absolutePath())
-            / "AIGenerated"
-            / "MyAIMotions"
-        )
-        motions_base.mkdir(parents=True, exist_ok=True)
+        self._add_category_symlinks("MyAIMotions")
 
-        modlist = self._organizer.modList().allModsByProfilePriority()
-        for mod_name in modlist:
-            if self._organizer.modList().state(mod_name) & mobase.ModState.ACTIVE:
-                mod = self._organizer.modList().getMod(mod_name)
-                if not mod:
-                    continue
+    def RemoveAIMotionsSymlinksOnExit(self):
+        self._remove_category_symlinks("MyAIMotions")
 
-                mod_path = Path(mod.absolutePath())
-                source_dir = mod_path / "MyAIMotions"
+    def AddMySitesSymlinksOnLaunch(self):
+        self._add_category_symlinks("MySites")
 
-                if not source_dir.is_dir():
-                    continue
+    def RemoveMySitesSymlinksOnExit(self):
+        self._remove_category_symlinks("MySites")
 
-                for actual_mod_folder in source_dir.iterdir():
-                    if actual_mod_folder.is_dir():
-                        target_dir = motions_base / actual_mod_folder.name
-                        if target_dir.exists():
-                            if target_dir.is_symlink():
-                                target_dir.unlink()
-                            else:
-                                logger.warning(
-                                    f"⚠️ Skipping non-symlink existing path: {target_dir}"
-                                )
-                                continue
-                        try:
-                            os.symlink(
-                                actual_mod_folder, target_dir, target_is_directory=True
-                            )
-                            logger.info(
-                                f"Created AIMotions 🔗symlink: {target_dir} → {actual_mod_folder}"
-                            )
-                        except Exception as e:
-                            logger.error(f"❌ Failed to create AIMotions symlink: {e}")
+    def AddMyAppearancesSymlinksOnLaunch(self):
+        self._add_category_symlinks("MyAppearances")
 
-    def RemoveAIMotionsSymlinksOnExit(self):
-        motions_base = (
-            Path(self.documentsDirectory().absolutePath())
-            / "AIGenerated"
-            / "MyAIMotions"
+    def RemoveMyAppearancesSymlinksOnExit(self):
+        self._remove_category_symlinks("MyAppearances")
+
+    # With VFS mapping on, MO2 overlays the category folders of every active mod
+    # onto the Documents categories for the launched process; nothing is linked
+    def mappings(self) -> list[mobase.Mapping]:
+        if not self.map_documents_vfs:
+            return []
+        mappings = []
+        for _, mod_path in self._launch_mod_paths():
+            for entry in scan_dir(mod_path):
+                if entry.name in DocumentCategories and entry.is_dir():
+                    mappings.append(
+                        mobase.Mapping(
+                            source=entry.path,
+                            destination=str(self._category_base(entry.name)),
+                            is_directory=True,
+                            create_target=False,
+                        )
+                    )
+        log_detail("🗺️ Mapped %d Documents category folders", len(mappings))
+        return mappings
+
+    def _launch_tracker(self) -> LaunchTracker:
+        if getattr(self, "_launch_tracker_cache", None) is None:
+            self._launch_tracker_cache = LaunchTracker(
+                self._cache_dir() / LaunchManifestFileName
+            )
+        return self._launch_tracker_cache
+
+    # Active mods as (name, path) in MO2 priority order, lowest priority first
+    def _active_mod_paths(self) -> list[tuple[str, Path]]:
+        mod_list = self._organizer.modList()
+        mod_paths = []
+        for mod_name in mod_list.allModsByProfilePriority():
+            if mod_list.state(mod_name) & mobase.ModState.ACTIVE:
+                mod = mod_list.getMod(mod_name)
+                if mod:
+                    mod_paths.append((mod_name, Path(mod.absolutePath())))
+        return mod_paths
+
+    # Active mods deployed at launch: without the shadowed ones when skipping
+    def _launch_mod_paths(self) -> list[tuple[str, Path]]:
+        skipped = getattr(self, "_shadowed_mods", set())
+        return [
+            (mod_name, mod_path)
+            for mod_name, mod_path in self._active_mod_paths()
+            if mod_name not in skipped
+        ]
+
+    def ReportShadowedMods(self) -> str:
+        started = time.perf_counter()
+        mod_paths = self._active_mod_paths()
+        shadowed = shadowed_mods(mod_paths)
+        summary = (
+            f"{len(shadowed)} of {len(mod_paths)} active mods are fully overridden "
+            f"by higher priority mods (resolved in {time.perf_counter() - started:.2f}s)."
+        )
+        logger.info("👻 %s", summary)
+        for mod_name in shadowed:
+            log_detail("👻 Shadowed mod: %s", mod_name)
+        return "\n".join([summary, *shadowed[:50]])
+
+    def ReportModUsage(self) -> str:
+        started = time.perf_counter()
+        mod_list = self._organizer.modList()
+        mods = {}
+        for mod_name in mod_list.allModsByProfilePriority():
+            mod = mod_list.getMod(mod_name)
+            if mod:
+                mods[mod_name] = Path(mod.absolutePath())
+        usage = ModUsageIndex(self._cache_dir() / UsageIndexFileName)
+        rescanned, folders = usage.refresh(mods)
+        totals = usage.totals()
+
+        per_mod = sorted(
+            (
+                (sum(size for size, _ in categories.values()), mod_name, categories)
+                for mod_name, categories in totals.items()
+            ),
+            reverse=True,
         )
+        per_category: dict[str, list[int]] = {}
+        for categories in totals.values():
+            for category, (size, count) in categories.items():
+                total = per_category.setdefault(category, [0, 0])
+                total[0] += size
+                total[1] += count
+
+        summary = (
+            f"{len(mods)} mods, {format_size(sum(size for size, _, _ in per_mod))} in "
+            f"{sum(count for _, count in per_category.values())} files "
+            f"({rescanned} of {folders} folders rescanned in {time.perf_counter() - started:.2f}s)"
+        )
+        lines = [summary, "", "Per category:"]
+        lines += [
+            f"  {category}: {format_size(size)}, {count} files"
+            for category, (size, count) in sorted(
+                per_category.items(), key=lambda item: -item[1][0]
+            )
+        ]
+        lines += ["", "Largest mods:"]
+        lines += [
+            f"  {mod_name}: {format_size(size)}, "
+            f"{sum(count for _, count in categories.values())} files"
+            for size, mod_name, categories in per_mod[:25]
+        ]
+        logger.info("📏 %s", summary)
+        return "\n".join(lines)
 
-        if motions_base.exists():
-            for child in motions_base.iterdir():
-                if child.is_symlink():
-                    try:
-                        child.unlink()
-                        logger.info(f"🧹 Removed AIMotions 🔗symlink: {child}")
-                    except Exception as e:
-                        logger.error(f"❌ Failed to remove AIMotions symlink: {e}")
+    def _game_update_detector(self) -> GameUpdateDetector:
+        return GameUpdateDetector(
+            self._cache_dir() / GameVersionFileName,
+            Path(self.gameDirectory().absolutePath()) / ModsPaksPath.parent,
+        )
 
-    def AddMySitesSymlinksOnLaunch(self):
-        mysites_base = (
-            Path(self.documentsDirectory().absolutePath()) / "Creations" / "MySites"
+    # Flags the active pak mods older than the game when it was just patched;
+    # afterwards only the mods still flagged are checked again
+    def CheckGameUpdate(self) -> list[str]:
+        started = time.perf_counter()
+        detector = self._game_update_detector()
+        mod_paths = self._active_mod_paths()
+        if detector.check():
+            flagged = detector.outdated_mods(mod_paths)
+            logger.warning(
+                "⚠️ 🆕 inZOI was updated, %d active pak mods predate the update",
+                len(flagged),
+            )
+        elif detector.flagged():
+            still_flagged = set(detector.flagged())
+            flagged = detector.outdated_mods(
+                [(name, path) for name, path in mod_paths if name in still_flagged]
+            )
+        else:
+            flagged = []
+        detector.set_flagged(flagged)
+        for mod_name in flagged:
+            logger.warning("⚠️ 🆕 Pak mod built for an older inZOI: %s", mod_name)
+        log_detail(
+            "🆕 Game update check took %.1f ms", (time.perf_counter() - started) * 1000
         )
-        mysites_base.mkdir(parents=True, exist_ok=True)
+        return flagged
+
+    def ReportOutdatedPakMods(self) -> str:
+        detector = self._game_update_detector()
+        updated_at = detector.state.get("updated_at")
+        if not updated_at:
+            return "No inZOI update seen since the plugin started tracking the game."
+        flagged = detector.outdated_mods(self._active_mod_paths())
+        detector.set_flagged(flagged)
+        summary = (
+            f"Last inZOI update: {time.strftime('%Y-%m-%d %H:%M', time.localtime(updated_at / 1e9))}. "
+            f"{len(flagged)} active pak mods predate it."
+        )
+        return "\n".join([summary, *flagged[:50]])
 
-        modlist = self._organizer.modList().allModsByProfilePriority()
-        for mod_name in modlist:
-            if self._organizer.modList().state(mod_name) & mobase.ModState.ACTIVE:
-                mod = self._organizer.modList().getMod(mod_name)
-                if not mod:
-                    continue
+    def ConsolidatePaksOnLaunch(self, force: bool = False) -> str:
+        if not self.pak_tool_path or not Path(self.pak_tool_path).is_file():
+            logger.warning(
+                "⚠️ Pak consolidation needs a valid '%s', skipping.",
+                PakToolSettingsName,
+            )
+            return "No pak tool configured."
 
-                mod_path = Path(mod.absolutePath())
-                source_dir = mod_path / "MySites"
+        all_paks, inputs, slot = PakConsolidator.collect_inputs(
+            self._launch_mod_paths()
+        )
+        if len(inputs) < 2:
+            return f"Only {len(inputs)} small paks active, nothing to merge."
 
-                if not source_dir.is_dir():
-                    continue
+        consolidator = PakConsolidator(self.pak_tool_path, self._cache_dir())
+        try:
+            stats = consolidator.build(inputs, force=force)
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.error("❌ Failed to build merged pak: %s", e)
+            return f"Failed to build merged pak: {e}"
+
+        tracker = self._launch_tracker()
+        target = Path(self.gameDirectory().absolutePath()) / ModsPaksPath / slot
+        # Hide the merged inputs from the VFS for this run. All or nothing: a
+        # pak left half hidden would be missing from both mount lists.
+        hidden_inputs: list[tuple[Path, Path]] = []
+        try:
+            for _, pak in inputs:
+                hidden = pak.with_name(pak.name + HiddenSuffix)
+                tracker.hide(pak, hidden)
+                hidden_inputs.append((pak, hidden))
+            make_dirs(target.parent)
+            # The slot belongs to a hidden input; anything there is not ours
+            if lstat_link(target) is not None:
+                raise FileExistsError(f"{target} already exists in the game folder")
+            link_file(consolidator.output_path, target)
+        except OSError as e:
+            logger.error("❌ Failed to deploy merged pak, keeping the inputs: %s", e)
+            for pak, hidden in reversed(hidden_inputs):
+                try:
+                    tracker.unhide(pak, hidden)
+                except OSError as restore_error:
+                    logger.error(
+                        "❌ Failed to restore hidden pak %s: %s", pak, restore_error
+                    )
+            return f"Failed to deploy merged pak: {e}"
+        tracker.add_link(target)
+        tracker.save()
+
+        mount_after = len(all_paks) - len(inputs) + 1
+        summary = (
+            f"Merged {len(inputs)} small paks: mount list {len(all_paks)} → {mount_after} paks, "
+            f"{'built' if stats['rebuilt'] else 'reused'} in {stats['seconds']:.2f}s."
+        )
+        logger.info("📦 %s", summary)
+        return summary
 
-                for actual_mod_folder in source_dir.iterdir():
-                    if actual_mod_folder.is_dir():
-                        target_dir = mysites_base / actual_mod_folder.name
-                        if target_dir.exists():
-                            if target_dir.is_symlink():
-                                target_dir.unlink()
-                            else:
-                                logger.warning(
-                                    f"⚠️ Skipping non-symlink existing path: {target_dir}"
-                                )
-                                continue
-                        try:
-                            os.symlink(
-                                actual_mod_folder, target_dir, target_is_directory=True
-                            )
-                            logger.info(
-                                f"Created AIMotions 🔗symlink: {target_dir} → {actual_mod_folder}"
-                            )
-                        except Exception as e:
-                            logger.error(f"❌ Failed to create AIMotions symlink: {e}")
+    def listSaves(self, folder: QDir) -> list[mobase.ISaveGame]:
+        if getattr(self, "_save_index", None) is None:
+            self._save_index = SaveGameIndex(self._cache_dir() / SaveIndexFileName)
+        return [
+            InzoiSaveGame(path, metadata)
+            for path, metadata in self._save_index.refresh(Path(folder.absolutePath()))
+        ]
 
-    def RemoveMySitesSymlinksOnExit(self):
-        mysites_base = (
-            Path(self.documentsDirectory().absolutePath()) / "Creations" / "MySites"
+    # The saves the game will use: the profile's own folder with local saves on
+    def _active_saves_dir(self) -> Path:
+        profile = self._organizer.profile()
+        if profile.localSavesEnabled():
+            return Path(profile.absolutePath()) / "saves"
+        return Path(self.savesDirectory().absolutePath())
+
+    def SnapshotSaves(self, protect: tuple[str, ...] = ()) -> str:
+        store = SaveSnapshotStore(self._cache_dir() / SnapshotFolderName)
+        profile_name = self._organizer.profileName()
+        stats = store.take(profile_name, self._active_saves_dir())
+        store.prune(profile_name, SnapshotKeepCount, protect)
+        summary = (
+            f"Save snapshot {stats['snapshot'] or '(unchanged, not stored)'}: "
+            f"{stats['changed']} of {stats['files']} files changed, "
+            f"{format_size(stats['bytes_written'])} written vs {format_size(stats['full_size'])} "
+            f"for a full copy, in {stats['seconds']:.2f}s"
         )
+        logger.info("💾 %s", summary)
+        return summary
+
+    def RestoreSaveSnapshot(self) -> str:
+        store = SaveSnapshotStore(self._cache_dir() / SnapshotFolderName)
+        profile_name = self._organizer.profileName()
+        snapshots = store.list(profile_name)
+        if not snapshots:
+            return f"No save snapshots for profile {profile_name}."
+        choice, ok = QInputDialog.getItem(
+            self._main_window,
+            "Restore save snapshot",
+            f"Snapshot of {profile_name} to restore:",
+            [snapshot.stem for snapshot in snapshots],
+            0,
+            False,
+        )
+        if not ok:
+            return ""
+
+        snapshot = store._profile_dir(profile_name) / f"{choice}.json"
+        store.load(snapshot)
+        # Keep the current state restorable too, without pruning the chosen one
+        self.SnapshotSaves((snapshot.name,))
+        started = time.perf_counter()
+        restored = store.restore(snapshot, self._active_saves_dir())
+        summary = f"Restored {choice}: {restored} files rewritten in {time.perf_counter() - started:.2f}s"
+        logger.info("💾 %s", summary)
+        return summary
+
+    def _glb_index(self) -> GlbIndex:
+        if getattr(self, "_glb_index_cache", None) is None:
+            self._glb_index_cache = GlbIndex(self._cache_dir() / GlbIndexFileName)
+        return self._glb_index_cache
+
+    # Loaded on first use and synced with the installed mods; unchanged mods
+    # cost one stat per category folder
+    def _creation_registry(self) -> CreationRegistry:
+        if getattr(self, "_creation_registry_cache", None) is None:
+            registry = CreationRegistry(self._cache_dir() / CreationRegistryFileName)
+            mod_list = self._organizer.modList()
+            mods = {}
+            for mod_name in mod_list.allModsByProfilePriority():
+                mod = mod_list.getMod(mod_name)
+                if mod:
+                    mods[mod_name] = Path(mod.absolutePath())
+            registry.sync(mods)
+            registry.save()
+            self._creation_registry_cache = registry
+        return self._creation_registry_cache
+
+    # A mod installed as inner .zip archives (see is_archive_wrapped) is laid
+    # out from them in place; returns the number of archives expanded
+    def _expand_inner_archives(self, mod_path: Path) -> int:
+        files = dict(walk_files(mod_path))
+        archives = [
+            Path(entry.path)
+            for relative, entry in files.items()
+            if relative.lower().endswith(".zip")
+        ]
+        if not archives:
+            return 0
+        if not is_archive_wrapped(list(files)):
+            logger.warning(
+                "⚠️ 📥 %s has inner archives next to other content, not expanding them",
+                mod_path.name,
+            )
+            return 0
+        expanded = 0
+        for archive in archives:
+            plan = BatchArchiveInstaller.classify(archive)
+            if not plan.error:
+                plan.mod_path = mod_path
+                BatchArchiveInstaller.extract(plan)
+            if plan.error:
+                logger.warning(
+                    "⚠️ 📥 Could not expand %s: %s", archive.name, plan.error
+                )
+                continue
+            expanded += 1
+            try:
+                os.unlink(archive)
+                wrapper = archive.parent
+                if wrapper != mod_path:
+                    # Readmes and the like next to the inner archive go with it
+                    for entry in scan_dir(wrapper):
+                        if entry.is_file() and _glob_match(
+                            entry.name, InzoiFilePatterns["delete"]
+                        ):
+                            os.unlink(entry.path)
+                    if not any(wrapper.iterdir()):
+                        wrapper.rmdir()
+            except OSError as e:
+                logger.warning("⚠️ 📥 Could not remove %s: %s", archive.name, e)
+            logger.info(
+                "📥 Expanded inner archive %s: %d files in %.2fs",
+                archive.name,
+                len(plan.destinations),
+                plan.seconds,
+            )
+        return expanded
+
+    def _onModInstalled(self, mod: mobase.IModInterface):
+        if self._expand_inner_archives(Path(mod.absolutePath())):
+            self._organizer.modDataChanged(mod)
+        glb_index = self._glb_index()
+        problems = glb_index.check_mod(Path(mod.absolutePath()), self.glb_max_size)
+        glb_index.save()
+        for glb, problem in problems:
+            logger.warning("⚠️ 🖨️ %s: %s %s", mod.name(), glb.name, problem)
+
+        registry = self._creation_registry()
+        registry.update_mod(mod.name(), Path(mod.absolutePath()))
+        registry.save()
+        conflicts = registry.conflicts(mod.name())
+        for creation_id, others in conflicts.items():
+            log_detail(
+                "🆔 %s: %s is also provided by %s",
+                mod.name(),
+                creation_id,
+                ", ".join(
+                    f"{other} ({category})" for other, category in others.items()
+                ),
+            )
+        if conflicts:
+            logger.warning(
+                "⚠️ 🆔 %s: %d creation IDs already exist in other mods: %s",
+                mod.name(),
+                len(conflicts),
+                ", ".join(
+                    sorted({other for others in conflicts.values() for other in others})
+                ),
+            )
 
-        if mysites_base.exists():
-            for child in mysites_base.iterdir():
-                if child.is_symlink():
-                    try:
-                        child.unlink()
-                        logger.info(f"🧹 Removed MySites 🔗symlink: {child}")
-                    except Exception as e:
-                        logger.error(f"❌ Failed to remove MySites symlink: {e}")
+    def _onModRemoved(self, mod_name: str):
+        registry = self._creation_registry()
+        registry.remove_mod(mod_name)
+        registry.save()
+        storage = self._cold_storage()
+        if storage.is_archived(mod_name) or mod_name in storage.inactive_since:
+            try:
+                storage.discard(mod_name)
+            except OSError as e:
+                logger.error("❌ 🧊 Failed to drop the archive of %s: %s", mod_name, e)
+
+    def FindCreationId(self) -> str:
+        creation_id, ok = QInputDialog.getText(
+            self._main_window, "Find creation ID", "Creation ID (MD5 folder name):"
+        )
+        creation_id = creation_id.strip().lower()
+        if not ok or not creation_id:
+            return ""
+        providers = self._creation_registry().lookup(creation_id)
+        if not providers:
+            return f"No installed mod provides {creation_id}."
+        return "\n".join(
+            [f"{creation_id} is provided by:"]
+            + [f"  {mod_name} ({category})" for mod_name, category in providers.items()]
+        )
 
-    def AddMyAppearancesSymlinksOnLaunch(self):
-        appearance_base = (
-            Path(self.documentsDirectory().absolutePath())
-            / "Creations"
-            / "MyAppearances"
+    def ReportDuplicateCreationIds(self) -> str:
+        registry = self._creation_registry()
+        duplicates = {
+            creation_id: providers
+            for creation_id, providers in registry.providers.items()
+            if len(providers) > 1
+        }
+        summary = (
+            f"{len(duplicates)} of {len(registry.providers)} creation IDs are "
+            f"provided by more than one mod."
+        )
+        lines = [
+            f"{creation_id}: {', '.join(providers)}"
+            for creation_id, providers in sorted(duplicates.items())
+        ]
+        logger.info("🆔 %s", summary)
+        return "\n".join([summary, *lines[:50]])
+
+    def Validate3DPrinterAssets(self) -> str:
+        started = time.perf_counter()
+        glb_index = self._glb_index()
+        max_size = self.glb_max_size
+        lines: list[str] = []
+        checked = 0
+        for mod_name in self._organizer.modList().allModsByProfilePriority():
+            mod = self._organizer.modList().getMod(mod_name)
+            if not mod:
+                continue
+            checked += 1
+            for glb, problem in glb_index.check_mod(Path(mod.absolutePath()), max_size):
+                lines.append(f"{mod_name}: {glb.parent.name}/{glb.name} {problem}")
+        glb_index.save()
+
+        summary = (
+            f"Checked {checked} mods in {time.perf_counter() - started:.2f}s, "
+            f"{len(lines)} problem assets."
+        )
+        for line in lines:
+            logger.warning("⚠️ 🖨️ %s", line)
+        logger.info("🖨️ %s", summary)
+        return "\n".join([summary, *lines[:50]])
+
+    # Forces a rebuild of the merged pak without deploying it
+    def BenchmarkPakConsolidation(self) -> str:
+        all_paks, inputs, _ = PakConsolidator.collect_inputs(self._active_mod_paths())
+        if not self.pak_tool_path or len(inputs) < 2:
+            return f"{len(all_paks)} active paks, {len(inputs)} mergeable; nothing to benchmark."
+        consolidator = PakConsolidator(self.pak_tool_path, self._cache_dir())
+        stats = consolidator.build(inputs, force=True)
+        return (
+            f"Mount list: {len(all_paks)} paks → {len(all_paks) - len(inputs) + 1} paks\n"
+            f"Merged pak build: {stats['seconds']:.2f}s for {len(inputs)} inputs "
+            f"({format_size(consolidator.output_path.stat().st_size)})"
         )
-        appearance_base.mkdir(parents=True, exist_ok=True)
 
-        modlist = self._organizer.modList().allModsByProfilePriority()
-        for mod_name in modlist:
-            if self._organizer.modList().state(mod_name) & mobase.ModState.ACTIVE:
-                mod = self._organizer.modList().getMod(mod_name)
-                if not mod:
-                    continue
+    # Compares reading the largest winning .ucas files through the VFS with
+    # reading the same files from physical links in ~mods.
+    def BenchmarkPakReads(self) -> str:
+        winners = winning_pak_files(self._active_mod_paths())
+        candidates = sorted(
+            (
+                (relative, source)
+                for relative, source in winners.items()
+                if source.suffix.lower() == ".ucas"
+            ),
+            key=lambda item: item[1].stat().st_size,
+            reverse=True,
+        )
+        selected: list[tuple[str, Path]] = []
+        total = 0
+        for relative, source in candidates:
+            if total >= PakBenchmarkBytes:
+                break
+            selected.append((relative, source))
+            total += source.stat().st_size
+        if not selected:
+            return "No active .ucas files to benchmark."
+
+        # Warm the OS cache so both runs measure the filesystem path, not the disk
+        for _, source in selected:
+            with open(source, "rb") as f:
+                while f.read(HashChunkSize):
+                    pass
+
+        target_base = Path(self.gameDirectory().absolutePath()) / ModsPaksPath
+        script = self._cache_dir() / "pak_read_benchmark.cmd"
+        write_read_script(script, [target_base / relative for relative, _ in selected])
+        self._benchmarking = True
+        try:
+            vfs_seconds = self._timed_application("cmd.exe", ["/c", str(script)])
+            self.AddPakLinksOnLaunch()
+            physical_seconds = self._timed_application("cmd.exe", ["/c", str(script)])
+        finally:
+            self._launch_tracker().undo()
+            self._benchmarking = False
+
+        summary = (
+            f"Read {len(selected)} .ucas files ({format_size(total)}):\n"
+            f"VFS: {vfs_seconds:.2f}s ({total / 1048576 / vfs_seconds:.0f} MB/s)\n"
+            f"Physical ~mods: {physical_seconds:.2f}s ({total / 1048576 / physical_seconds:.0f} MB/s)"
+        )
+        logger.info("📦 %s", summary.replace("\n", " | "))
+        return summary
+
+    # Times a no-op launch through MO2 with the Documents categories deployed as
+    # links and as VFS mappings. Only the Documents part of the launch and exit
+    # hooks runs, so snapshots, pak handling and the update check don't skew it.
+    def BenchmarkDocumentsDeployment(self, runs: int = 3) -> str:
+        results = {}
+        # The symlink pass would write into and then empty the active farms
+        farms_active = self.use_link_farms
+        if farms_active:
+            self.DeactivateLinkFarms()
+        # Pin every setting that picks the deployment path, so the symlink pass
+        # really deploys and removes symlinks on each run
+        modes = (
+            (
+                "Symlinks",
+                {
+                    VfsMappingSettingsName: False,
+                    LinkFarmSettingsName: False,
+                    PersistentDeploySettingsName: False,
+                    SymLinkSettingsName: True,
+                },
+            ),
+            ("VFS mappings", {VfsMappingSettingsName: True}),
+        )
+        self._benchmarking_documents = True
+        try:
+            for mode, forced in modes:
+                self._forced_settings = forced
+                results[mode] = sorted(
+                    self._timed_application("cmd.exe", ["/c", "exit"])
+                    for _ in range(runs)
+                )[runs // 2]
+        finally:
+            self._forced_settings = {}
+            self._benchmarking_documents = False
+            # Links kept between runs were removed by the symlink pass
+            self._forget_deployment()
+            if farms_active:
+                self.ActivateLinkFarms()
+
+        folders = sum(
+            len(scan_subdirs(mod_path / category))
+            for _, mod_path in self._launch_mod_paths()
+            for category in DocumentCategories
+        )
+        summary = (
+            f"Launch + exit with {folders} Documents MD5 folders (median of {runs}):\n"
+        )
+        summary += "\n".join(
+            f"{mode}: {seconds:.3f}s" for mode, seconds in results.items()
+        )
+        logger.info("🗺️ %s", summary.replace("\n", " | "))
+        return summary
+
+    # Runs an executable through MO2 (and so through the VFS) and times it
+    def _timed_application(self, executable: str, args: list[str]) -> float:
+        started = time.perf_counter()
+        handle = self._organizer.startApplication(
+            executable, args, self.gameDirectory().absolutePath()
+        )
+        self._organizer.waitForApplication(handle, False)
+        return time.perf_counter() - started
+
+    # Restores the archived mods among mod_names, all at once
+    def _rehydrate_mods(self, mod_names: list[str]):
+        storage = self._cold_storage()
+        mod_list = self._organizer.modList()
+        mods = {
+            mod_name: mod_list.getMod(mod_name)
+            for mod_name in mod_names
+            if storage.is_archived(mod_name) and mod_list.getMod(mod_name)
+        }
+        if not mods:
+            return
+        sizes = {mod_name: storage.archived[mod_name]["bytes"] for mod_name in mods}
+        started = time.perf_counter()
+        results = storage.rehydrate_all(
+            {mod_name: Path(mod.absolutePath()) for mod_name, mod in mods.items()}
+        )
+        seconds = time.perf_counter() - started
+        restored = 0
+        for mod_name, result in results.items():
+            if isinstance(result, str):
+                logger.error("❌ 🧊 Failed to restore %s: %s", mod_name, result)
+                continue
+            restored += sizes[mod_name]
+            self._organizer.modDataChanged(mods[mod_name])
+        logger.info(
+            "🧊 Restored %d mods (%s) from cold storage in %.2fs, %.2fs per GB",
+            len(results),
+            format_size(restored),
+            seconds,
+            seconds / max(restored / 1024**3, 1e-9),
+        )
 
-                mod_path = Path(mod.absolutePath())
-                source_dir = mod_path / "MyAppearances"
+    # Updates since when each mod has been disabled in every profile
+    def _observe_mod_activity(self) -> ColdStorage:
+        storage = self._cold_storage()
+        # modlist.txt of the current profile may lag behind, so ask MO2 too
+        active = profile_active_mods(Path(self._organizer.profilePath()).parent)
+        active.update(mod_name for mod_name, _ in self._active_mod_paths())
+        storage.observe(
+            list(self._organizer.modList().allModsByProfilePriority()), active
+        )
+        storage.save()
+        return storage
+
+    # Archives the mods disabled in every profile for longer than the setting
+    def ArchiveDisabledMods(self) -> str:
+        days = self.cold_storage_days
+        if not days:
+            return f"Cold storage is off, set '{ColdStorageSettingsName}' first."
+        started = time.perf_counter()
+        storage = self._observe_mod_activity()
+        mod_list = self._organizer.modList()
+        mod_names = list(mod_list.allModsByProfilePriority())
+        mods = {}
+        for mod_name in storage.candidates(mod_names, days):
+            mod = mod_list.getMod(mod_name)
+            if mod and not mod.isSeparator():
+                mods[mod_name] = Path(mod.absolutePath())
+        results = storage.archive_all(mods)
+
+        archived = [
+            record for record in results.values() if isinstance(record, dict) and record
+        ]
+        for mod_name, result in results.items():
+            if isinstance(result, str):
+                logger.error("❌ 🧊 Failed to archive %s: %s", mod_name, result)
+            elif result:
+                self._organizer.modDataChanged(mod_list.getMod(mod_name))
+        original = sum(record["bytes"] for record in archived)
+        saved = original - sum(record["stored_bytes"] for record in archived)
+        summary = (
+            f"Archived {len(archived)} mods disabled for over {days} days "
+            f"({sum(record['files'] for record in archived)} files, {format_size(original)}), "
+            f"saved {format_size(saved)} in {time.perf_counter() - started:.1f}s. "
+            f"{len(storage.archived)} mods in cold storage."
+        )
+        logger.info("🧊 %s", summary)
+        return summary
+
+    def DeduplicateMods(self, hardlink: bool = False) -> str:
+        deduplicator = ModDeduplicator(
+            Path(self._organizer.modsPath()),
+            self._store_dir(),
+            self._cache_dir() / DedupIndexFileName,
+        )
+        duplicates = deduplicator.find_duplicates()
+        reclaimable = deduplicator.reclaimable_bytes(duplicates)
+        summary = (
+            f"{sum(len(paths) for paths in duplicates.values())} files in "
+            f"{len(duplicates)} duplicate groups, {format_size(reclaimable)} reclaimable."
+        )
 
-                if not source_dir.is_dir():
-                    continue
+        if hardlink and duplicates:
+            started = time.perf_counter()
+            linked = deduplicator.hardlink_duplicates(duplicates)
+            pruned = deduplicator.prune_store()
+            summary += (
+                f"\nHardlinked {linked} files into {self._store_dir()} "
+                f"in {time.perf_counter() - started:.2f}s, pruned {pruned} unused store objects."
+            )
 
-                for actual_mod_folder in source_dir.iterdir():
-                    if actual_mod_folder.is_dir():
-                        target_dir = appearance_base / actual_mod_folder.name
-                        if target_dir.exists():
-                            if target_dir.is_symlink():
-                                target_dir.unlink()
-                            else:
-                                logger.warning(
-                                    f"⚠️ Skipping non-symlink existing path: {target_dir}"
-                                )
-                                continue
-                        try:
-                            os.symlink(
-                                actual_mod_folder, target_dir, target_is_directory=True
-                            )
-                            logger.info(
-                                f"Created MyAppearances 🔗symlink: {target_dir} → {actual_mod_folder}"
-                            )
-                        except Exception as e:
-                            logger.error(
-                                f"❌ Failed to create MyAppearances symlink: {e}"
-                            )
+        logger.info("♻️ %s", summary)
+        return summary
 
-    def RemoveMyAppearancesSymlinksOnExit(self):
-        appearance_base = (
-            Path(self.documentsDirectory().absolutePath())
-            / "Creations"
-            / "MyAppearances"
-        )
+    def InstallArchiveBatch(self, archives: list[str | Path] | None = None) -> str:
+        if archives is None:
+            archives, _ = QFileDialog.getOpenFileNames(
+                self._main_window,
+                "Install inZOI mod archives",
+                self._organizer.downloadsPath(),
+                "Mod archives (*.zip *.7z *.rar)",
+            )
+        if not archives:
+            return ""
+
+        started = time.perf_counter()
+        archives = [Path(archive) for archive in archives]
+        zips = [archive for archive in archives if archive.suffix.lower() == ".zip"]
+        others = [archive for archive in archives if archive not in zips]
+        installer = BatchArchiveInstaller()
+        plans = installer.classify_all(zips)
+        classified = time.perf_counter() - started
+
+        # Mods are created on the UI thread, in batch order
+        mod_list = self._organizer.modList()
+        ready = []
+        for plan in plans:
+            if plan.error:
+                continue
+            name = plan.archive.stem
+            suffix = 2
+            while mod_list.getMod(name):
+                name = f"{plan.archive.stem} ({suffix})"
+                suffix += 1
+            mod = self._organizer.createMod(mobase.GuessedString(name))
+            if not mod:
+                plan.error = "MO2 refused to create the mod"
+                continue
+            plan.mod_path = Path(mod.absolutePath())
+            ready.append((name, mod, plan))
+
+        installer.extract_all([plan for _, _, plan in ready])
+        # Don't leave half-extracted mods behind in the mod list
+        for _, mod, plan in ready:
+            if plan.error and not mod_list.removeMod(mod):
+                shutil.rmtree(plan.mod_path, ignore_errors=True)
+        self._organizer.refresh(False)
+
+        # Place each new mod at the bottom of the list so batch order = priority order
+        installed = []
+        for name, _, plan in ready:
+            if plan.error:
+                continue
+            mod_list.setPriority(name, len(mod_list.allModsByProfilePriority()) - 1)
+            installed.append(name)
+        if installed:
+            mod_list.setActive(installed, True)
+
+        # Anything that isn't a zip goes through MO2's own installer, one by one
+        for archive in others:
+            if self._organizer.installMod(str(archive)):
+                installed.append(archive.name)
+            else:
+                failed = ArchivePlan(archive)
+                failed.error = "MO2 installer failed or was cancelled"
+                plans.append(failed)
+
+        total_seconds = time.perf_counter() - started
+        lines = [
+            f"Installed {len(installed)} of {len(archives)} archives "
+            f"in {total_seconds:.1f}s (classified in {classified:.2f}s)."
+        ]
+        for plan in plans:
+            if plan.error:
+                lines.append(f"❌ {plan.archive.name}: {plan.error}")
+            elif plan.seconds:
+                lines.append(
+                    f"{plan.archive.name}: {format_size(plan.total_bytes)} in {plan.seconds:.2f}s "
+                    f"({plan.total_bytes / 1048576 / plan.seconds:.1f} MB/s)"
+                )
+        for line in lines:
+            logger.info("📥 %s", line)
+        return "\n".join(lines[:60])
+
+    def _onUserInterfaceInitialized(self, main_window: QMainWindow):
+        self._main_window = main_window
+        if self.cold_storage_days:
+            self._observe_mod_activity()
+
+    # (group, label, callback) of the tools registered in MO2's Tools menu, each
+    # callback returns a report
+    def _tool_actions(self):
+        return [
+            ("Mods", "Install archive batch...", self.InstallArchiveBatch),
+            ("Mods", "Find creation ID...", self.FindCreationId),
+            (
+                "Mods",
+                "Deduplicate mod files (hardlink)",
+                lambda: self.DeduplicateMods(True),
+            ),
+            ("Mods", "Archive long-disabled mods", self.ArchiveDisabledMods),
+            ("Saves", "Snapshot saves now", self.SnapshotSaves),
+            ("Saves", "Restore save snapshot...", self.RestoreSaveSnapshot),
+            ("Reports", "Duplicate mod files", lambda: self.DeduplicateMods(False)),
+            ("Reports", "Shadowed mods", self.ReportShadowedMods),
+            ("Reports", "Pak mods older than the game", self.ReportOutdatedPakMods),
+            ("Reports", "Duplicate creation IDs", self.ReportDuplicateCreationIds),
+            ("Reports", "Mod disk usage", self.ReportModUsage),
+            ("Reports", "Validate 3DPrinter assets", self.Validate3DPrinterAssets),
+            ("Benchmarks", "Pak consolidation", self.BenchmarkPakConsolidation),
+            ("Benchmarks", "Pak reads (VFS vs physical)", self.BenchmarkPakReads),
+            (
+                "Benchmarks",
+                "Documents deployment (symlinks vs VFS)",
+                self.BenchmarkDocumentsDeployment,
+            ),
+        ]
 
-        if appearance_base.exists():
-            for child in appearance_base.iterdir():
-                if child.is_symlink():
-                    try:
-                        child.unlink()
-                        logger.info(f"🧹 Removed MyAppearances 🔗symlink: {child}")
-                    except Exception as e:
-                        logger.error(f"❌ Failed to remove MyAppearances symlink: {e}")
+    def _run_tool(self, main_window: QMainWindow, callback):
+        try:
+            report = callback()
+        except Exception as e:
+            logger.error("❌ inZOI tool failed: %s", e)
+            report = f"Failed: {e}"
+        if report:
+            QMessageBox.information(main_window, "inZOI", report)
 
     def _onAboutToRun(self, path: str):
-        logger.info(f"🐸 Application about to run: {path}")
+        if getattr(self, "_benchmarking", False):
+            return True
+        if getattr(self, "_benchmarking_documents", False):
+            self._deploy_documents_for_launch()
+            return True
+        logger.info("🐸 Application about to run: %s", path)
+        fs_stats.reset()
+        # Enabled outside this plugin's view (e.g. by another tool), restore now
+        self._rehydrate_mods([mod_name for mod_name, _ in self._active_mod_paths()])
+        self._shadowed_mods = set()
+        if self.skip_shadowed_mods:
+            self._shadowed_mods = set(shadowed_mods(self._active_mod_paths()))
+            logger.info(
+                "👻 Skipping %d fully overridden mods in this launch",
+                len(self._shadowed_mods),
+            )
+        if self.snapshot_saves:
+            try:
+                self.SnapshotSaves()
+            except OSError as e:
+                logger.error("❌ Save snapshot failed: %s", e)
+        try:
+            self.CheckGameUpdate()
+        except OSError as e:
+            logger.error("❌ Game update check failed: %s", e)
         self.AddBitfixSymlinksOnLaunch()
-        if self.deploy_symlinkmods:
-            self.Add3DPrinterSymlinksOnLaunch()
-            self.AddAIMotionsSymlinksOnLaunch()
-            self.AddMySitesSymlinksOnLaunch()
-            self.AddMyAppearancesSymlinksOnLaunch()
+        if self.merge_small_paks:
+            self.ConsolidatePaksOnLaunch()
+        if self.deploy_paks_physically:
+            self.AddPakLinksOnLaunch()
+        self._deploy_documents_for_launch()
+        log_detail("📊 Launch filesystem calls: %s", fs_stats)
+        if Path(path).name.lower() in GameExecutableNames:
+            self._game_running = True
         return True
 
     def _onFinishedRun(self, path: str, exit_code: int):
-        logger.info(f"🐸 Application finished running: {path}, exit code: {exit_code}")
+        if getattr(self, "_benchmarking", False):
+            return True
+        if getattr(self, "_benchmarking_documents", False):
+            self._remove_documents_after_run()
+            return True
+        logger.info(
+            "🐸 Application finished running: %s, exit code: %s", path, exit_code
+        )
+        if Path(path).name.lower() in GameExecutableNames:
+            self._game_running = False
+        self._shadowed_mods = set()
+        fs_stats.reset()
         self.RemoveBitfixSymlinksOnExit()
-        if self.deploy_symlinkmods:
+        removed, restored = self._launch_tracker().undo()
+        if removed or restored:
+            logger.info(
+                "🧹 Removed %s tracked links, restored %s hidden files",
+                removed,
+                restored,
+            )
+        self._remove_documents_after_run()
+        log_detail("📊 Exit filesystem calls: %s", fs_stats)
+        return True
+
+    # Makes the Documents categories visible to the launched process in the
+    # configured deployment mode
+    def _deploy_documents_for_launch(self):
+        if self.map_documents_vfs:
+            for category in DocumentCategories:
+                make_dirs(self._category_base(category))
+        elif self.use_link_farms:
+            # Categories left as real folders get launch links, undone at exit
+            tracker = self._launch_tracker()
+            for category in self.ActivateLinkFarms():
+                self._add_category_symlinks(category)
+                base = self._category_base(category)
+                for name, is_link in scan_links(base).items():
+                    if is_link:
+                        tracker.add_link(base / name)
+            tracker.save()
+        elif self.deploy_symlinkmods:
+            self._deploy_documents_on_launch()
+
+    # Removes the Documents links of the run unless the mode keeps them
+    def _remove_documents_after_run(self):
+        if (
+            self.deploy_symlinkmods
+            and not self.use_link_farms
+            and not self.persistent_deployment
+            and not self.map_documents_vfs
+        ):
             self.Remove3DPrinterSymlinksOnExit()
             self.RemoveAIMotionsSymlinksOnExit()
             self.RemoveMySitesSymlinksOnExit()
             self.RemoveMyAppearancesSymlinksOnExit()
-        return True
 
     def settings(self) -> list[mobase.PluginSetting]:
         return [
@@ -1126,11 +4142,61 @@ class InzoiGame(BasicGame):
                 ),
                 default_value=True,
             ),
+            mobase.PluginSetting(
+                LinkFarmSettingsName,
+                "Keeps a prebuilt link folder per profile for 3DPrinter, MyAIMotions, MySites and MyAppearances mods and swaps it in atomically on profile switch. Links stay in place between runs.",
+                default_value=False,
+            ),
+            mobase.PluginSetting(
+                VfsMappingSettingsName,
+                "Maps the 3DPrinter, MyAIMotions, MySites and MyAppearances folders of the active mods into Documents through MO2's VFS instead of creating symlinks. Only the launched game sees them.",
+                default_value=False,
+            ),
+            mobase.PluginSetting(
+                PersistentDeploySettingsName,
+                "With symlinks deployed on launch, leaves them in place at exit and skips redeploying when the active mods, their order and contents are unchanged.",
+                default_value=False,
+            ),
+            mobase.PluginSetting(
+                SkipShadowedSettingsName,
+                "Leaves mods whose files and MD5 folders are all overridden by higher priority mods out of the launch deployment.",
+                default_value=False,
+            ),
+            mobase.PluginSetting(
+                ColdStorageSettingsName,
+                "Mods disabled in every profile for this many days can be compressed into cold storage from Tools > inZOI > Mods. They are restored automatically when enabled. 0 disables cold storage.",
+                default_value=0,
+            ),
+            mobase.PluginSetting(
+                SnapshotSettingsName,
+                "Takes an incremental, compressed snapshot of the profile's saves before every launch. Restore them from Tools > inZOI > Saves.",
+                default_value=False,
+            ),
             mobase.PluginSetting(
                 "LogLevel",
                 "Controls the level of detail in the plugin log. Options: Info, Debug",
                 default_value="Info",
             ),
+            mobase.PluginSetting(
+                GlbMaxSizeSettingsName,
+                "3DPrinter .glb files larger than this are flagged at install and by the asset validation. 0 disables the check.",
+                default_value=100,
+            ),
+            mobase.PluginSetting(
+                PakMergeSettingsName,
+                "Merges the active small .pak mods into one generated pak at launch to cut the game's mount list. Needs a pak tool.",
+                default_value=False,
+            ),
+            mobase.PluginSetting(
+                PakDeploySettingsName,
+                "Links the winning ~mods .pak/.utoc/.ucas files physically into the game folder at launch, so the game reads them without going through the VFS.",
+                default_value=False,
+            ),
+            mobase.PluginSetting(
+                PakToolSettingsName,
+                "Path to the pak tool (e.g. repak.exe) used to unpack and pack paks for consolidation.",
+                default_value="",
+            ),
         ]
 
     def _settings_change_callback(
@@ -1143,11 +4209,87 @@ class InzoiGame(BasicGame):
         if plugin_name == self.name():
             global LogLevel
             LogLevel = self.loglevel
-            if LogLevel == "Debug":
-                logger.info(
-                    f"🐸 Plugin setting changed: {setting} = {new}, old value: {old}"
-                )
+            if setting == PersistentDeploySettingsName and not new:
+                # Links kept from the last run would otherwise never be removed
+                self._forget_deployment()
+                if self.deploy_symlinkmods and not self.use_link_farms:
+                    for category in DocumentCategories:
+                        self._remove_category_symlinks(category)
+            if setting == VfsMappingSettingsName and new:
+                # Links left from the other modes would shadow the mapped folders
+                if self.use_link_farms:
+                    self.DeactivateLinkFarms()
+                self._forget_deployment()
+                for category in DocumentCategories:
+                    remove_dir_links(self._category_base(category))
+            if setting == LinkFarmSettingsName:
+                if new:
+                    self.ActivateLinkFarms()
+                else:
+                    self.DeactivateLinkFarms()
+            log_detail(
+                "🐸 Plugin setting changed: %s = %s, old value: %s", setting, new, old
+            )
+
+
+class InzoiTool(mobase.IPluginTool):
+    """One inZOI maintenance action in MO2's Tools menu.
+
+    The work is done by the game plugin; a tool forwards to its callback and
+    shows the returned report. Tools are grouped in submenus through the slashes
+    in their display name and only show up while inZOI is the managed game.
+    """
+
+    def __init__(self, game: InzoiGame, group: str, label: str, callback):
+        super().__init__()
+        self._game = game
+        self._group = group
+        self._label = label
+        self._callback = callback
+
+    def init(self, organizer: IOrganizer) -> bool:
+        return True
+
+    def name(self) -> str:
+        return f"inZOI {self._group}: {self._label}"
+
+    def author(self) -> str:
+        return InzoiGame.Author
+
+    def description(self) -> str:
+        return f"inZOI {self._group.lower()}: {self._label}"
+
+    def version(self) -> mobase.VersionInfo:
+        return mobase.VersionInfo(InzoiGame.Version)
+
+    def master(self) -> str:
+        return InzoiGame.Name
+
+    def requirements(self) -> list[mobase.IPluginRequirement]:
+        return [mobase.PluginRequirementFactory.gameDependency(InzoiGame.GameName)]
+
+    def settings(self) -> list[mobase.PluginSetting]:
+        return []
+
+    def displayName(self) -> str:
+        return f"inZOI/{self._group}/{self._label}"
+
+    def tooltip(self) -> str:
+        return self.description()
+
+    def icon(self) -> QIcon:
+        return QIcon()
+
+    def display(self) -> None:
+        self._game._run_tool(self._game._main_window, self._callback)
 
 
-def createPlugin() -> IPlugin:
-    return InzoiGame()
+def createPlugins() -> list[IPlugin]:
+    game = InzoiGame()
+    return [
+        game,
+        *(
+            InzoiTool(game, group, label, callback)
+            for group, label, callback in game._tool_actions()
+        ),
+    ]